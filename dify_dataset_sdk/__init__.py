@@ -4,6 +4,8 @@ This SDK provides a modular interface to the Dify Knowledge Base API with
 separate clients for different resource types:
 
 - DifyDatasetClient: Main client with access to all sub-clients
+- AsyncDifyDatasetClient: Async client for concurrent tag/metadata operations
+- enable_uvloop: Opt-in faster event loop for the async client
 - datasets: Dataset management (create, list, update, delete, retrieve)
 - documents: Document management (text/file upload, update, delete)
 - segments: Segment and child chunk management
@@ -55,7 +57,8 @@ from ._exceptions import (
     DifyTimeoutError,
     DifyValidationError,
 )
-from .client import DifyDatasetClient
+from ._loop import enable_uvloop
+from .client import AsyncDifyDatasetClient, DifyDatasetClient
 
 # Dataset models
 from .datasets import (
@@ -119,10 +122,13 @@ from .metadata import (
 
 # Tag models
 from .tags import (
+    BatchOp,
+    BatchResult,
     BindDatasetToTagRequest,
     CreateKnowledgeTagRequest,
     DatasetTagsResponse,
     DeleteKnowledgeTagRequest,
+    FastKnowledgeTag,
     KnowledgeTag,
     UnbindDatasetFromTagRequest,
     UpdateKnowledgeTagRequest,
@@ -133,6 +139,8 @@ __version__ = "0.5.0"
 __all__ = [
     # Main client
     "DifyDatasetClient",
+    "AsyncDifyDatasetClient",
+    "enable_uvloop",
     # Exceptions
     "DifyError",
     "DifyAPIError",
@@ -183,12 +191,15 @@ __all__ = [
     "UpdateChildChunkRequest",
     # Tag models
     "KnowledgeTag",
+    "FastKnowledgeTag",
     "CreateKnowledgeTagRequest",
     "UpdateKnowledgeTagRequest",
     "DeleteKnowledgeTagRequest",
     "BindDatasetToTagRequest",
     "UnbindDatasetFromTagRequest",
     "DatasetTagsResponse",
+    "BatchOp",
+    "BatchResult",
     # Metadata models
     "Metadata",
     "MetadataValue",
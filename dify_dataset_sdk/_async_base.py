@@ -0,0 +1,384 @@
+"""Async HTTP client for Dify API."""
+
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Literal,
+    Optional,
+    Tuple,
+)
+
+import httpx
+
+from ._base import (
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    _as_dict,
+    _default_headers,
+    _handle_status,
+)
+from ._exceptions import DifyAPIError, DifyConnectionError, DifyTimeoutError
+from ._json import JSON_HEADERS, JSONItemParser, dumps
+
+if TYPE_CHECKING:
+    import aiohttp
+
+AsyncTransport = Literal["httpx", "aiohttp"]
+
+
+class AsyncBaseClient:
+    """Async HTTP client for Dify API.
+
+    Mirrors BaseClient for use on an asyncio event loop, so independent
+    requests can be awaited concurrently (e.g. with ``asyncio.gather``)
+    instead of paying one round trip after another. Responses are mapped
+    to the same exception types as the sync client.
+
+    Two transports sit behind the same interface:
+
+    - ``"httpx"`` (default): ``httpx.AsyncClient`` with HTTP/2, so
+      concurrent requests to an HTTPS endpoint are multiplexed as streams
+      over a few pooled connections instead of one TCP/TLS connection each.
+    - ``"aiohttp"``: ``aiohttp.ClientSession`` over HTTP/1.1, which tends to
+      hold up better under very high fan-out. Requires the optional
+      ``aiohttp`` dependency (``pip install "dify-dataset-sdk[async]"``).
+
+    Attributes:
+        api_key (str): API key for authentication
+        base_url (str): Base URL for API endpoints
+        timeout (float): Request timeout in seconds
+        transport (str): Name of the HTTP transport in use
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.dify.ai",
+        timeout: float = 30.0,
+        transport: AsyncTransport = "httpx",
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    ) -> None:
+        """Initialize the async base client.
+
+        With the aiohttp transport, the ``aiohttp.ClientSession`` is created
+        lazily on the first request so that it is bound to the running loop.
+
+        Args:
+            api_key: Dify API key for authentication
+            base_url: Base URL for the Dify API (default: https://api.dify.ai)
+            timeout: Request timeout in seconds (default: 30.0)
+            transport: HTTP transport, 'httpx' or 'aiohttp' (default: 'httpx')
+            http2: Enable HTTP/2 for HTTPS endpoints; httpx transport only
+                (default: True)
+            max_connections: Maximum number of pooled connections (default: 100)
+            max_keepalive_connections: Maximum number of idle connections kept
+                alive for reuse; httpx transport only (default: 50)
+
+        Raises:
+            ValueError: If api_key is empty or None, or transport is unknown
+            ImportError: If the aiohttp transport is requested but aiohttp is
+                not installed
+        """
+        if not api_key or not api_key.strip():
+            raise ValueError("API key cannot be empty")
+        if transport not in ("httpx", "aiohttp"):
+            raise ValueError(f"Unknown transport: {transport!r} (expected 'httpx' or 'aiohttp')")
+        if transport == "aiohttp":
+            try:
+                import aiohttp  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "The aiohttp transport requires aiohttp. Install it with: pip install 'dify-dataset-sdk[async]'"
+                ) from e
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.transport = transport
+        self._max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        if transport == "httpx":
+            self._client = httpx.AsyncClient(
+                headers=self._get_headers(),
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+                timeout=httpx.Timeout(timeout),
+            )
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get default headers for API requests.
+
+        Returns:
+            Dictionary containing standard headers for Dify API requests
+        """
+        return _default_headers(self.api_key)
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared aiohttp session, creating it on first use.
+
+        Returns:
+            Open aiohttp client session
+        """
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._get_headers(),
+                connector=aiohttp.TCPConnector(limit=self._max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+    ) -> Any:
+        """Make HTTP request."""
+        return (await self._request_with_status(method, path, json, params, content))[1]
+
+    async def _request_with_status(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Make HTTP request and return the status code with the parsed body."""
+        url = f"{self.base_url}{path}"
+        if params:
+            params = {key: value for key, value in params.items() if value is not None}
+        if content is None and json is not None:
+            content = dumps(json)
+
+        if self._client is not None:
+            return await self._request_httpx(self._client, method, url, content, params)
+        return await self._request_aiohttp(method, url, content, params)
+
+    async def _request_httpx(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        content: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Send a request with the httpx transport."""
+        kwargs: Dict[str, Any] = {"params": params}
+        if content is not None:
+            kwargs["content"] = content
+            kwargs["headers"] = JSON_HEADERS
+
+        try:
+            response = await client.request(method, url, **kwargs)
+            return response.status_code, _as_dict(_handle_status(response.status_code, response.content))
+
+        except httpx.TimeoutException as e:
+            raise DifyTimeoutError("Request timeout") from e
+        except httpx.ConnectError as e:
+            raise DifyConnectionError("Failed to connect to Dify API") from e
+        except httpx.HTTPError as e:
+            raise DifyConnectionError(f"HTTP error: {str(e)}") from e
+
+    async def _request_aiohttp(
+        self,
+        method: str,
+        url: str,
+        content: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Send a request with the aiohttp transport."""
+        import aiohttp
+
+        kwargs: Dict[str, Any] = {"params": params}
+        if content is not None:
+            kwargs["data"] = content
+            kwargs["headers"] = JSON_HEADERS
+
+        try:
+            async with self._get_session().request(method, url, **kwargs) as response:
+                body = await response.read()
+                return response.status, _as_dict(_handle_status(response.status, body))
+
+        except asyncio.TimeoutError as e:
+            raise DifyTimeoutError("Request timeout") from e
+        except aiohttp.ClientConnectorError as e:
+            raise DifyConnectionError("Failed to connect to Dify API") from e
+        except aiohttp.ClientError as e:
+            raise DifyConnectionError(f"HTTP error: {str(e)}") from e
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Make GET request."""
+        return await self._request("GET", path, params=params)
+
+    async def post(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+    ) -> Any:
+        """Make POST request.
+
+        ``content`` sends an already encoded JSON body as is, in place of ``json``.
+        """
+        return await self._request("POST", path, json=json, content=content)
+
+    async def patch(self, path: str, json: Optional[Dict[str, Any]] = None) -> Any:
+        """Make PATCH request."""
+        return await self._request("PATCH", path, json=json)
+
+    async def delete(self, path: str, json: Optional[Dict[str, Any]] = None) -> Any:
+        """Make DELETE request."""
+        return await self._request("DELETE", path, json=json)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make request with an arbitrary HTTP method."""
+        return await self._request(method, path, json=json, params=params)
+
+    async def request_with_status(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Make request with an arbitrary HTTP method, returning (status code, body)."""
+        return await self._request_with_status(method, path, json=json, params=params)
+
+    async def stream_items(
+        self,
+        method: str,
+        path: str,
+        prefix: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Any]:
+        """Make request and yield the JSON values at ``prefix`` as they arrive.
+
+        Async counterpart of ``BaseClient.stream_items``.
+
+        Args:
+            method: HTTP method
+            path: Request path
+            prefix: ijson-style path of the values to yield, e.g.
+                ``"doc_metadata.item"``
+            params: Query parameters (optional)
+
+        Yields:
+            Decoded JSON values
+
+        Raises:
+            DifyAPIError: If the request fails or the body is not valid JSON
+            DifyTimeoutError: If the request times out
+            DifyConnectionError: For connection-related errors
+        """
+        url = f"{self.base_url}{path}"
+        if params:
+            params = {key: value for key, value in params.items() if value is not None}
+
+        if self._client is not None:
+            chunks = self._stream_httpx(self._client, method, url, params)
+        else:
+            chunks = self._stream_aiohttp(method, url, params)
+        parser = JSONItemParser(prefix)
+        try:
+            async for chunk in chunks:
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+        except ValueError as e:
+            raise DifyAPIError(f"Invalid JSON response: {str(e)}", 200) from e
+        finally:
+            await chunks.aclose()
+
+    async def _stream_httpx(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the raw body of a successful response with the httpx transport."""
+        try:
+            async with client.stream(method, url, params=params) as response:
+                if response.status_code not in (200, 201):
+                    _handle_status(response.status_code, await response.aread())
+                    return
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+
+        except httpx.TimeoutException as e:
+            raise DifyTimeoutError("Request timeout") from e
+        except httpx.ConnectError as e:
+            raise DifyConnectionError("Failed to connect to Dify API") from e
+        except httpx.HTTPError as e:
+            raise DifyConnectionError(f"HTTP error: {str(e)}") from e
+
+    async def _stream_aiohttp(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the raw body of a successful response with the aiohttp transport."""
+        import aiohttp
+
+        try:
+            async with self._get_session().request(method, url, params=params) as response:
+                if response.status not in (200, 201):
+                    _handle_status(response.status, await response.read())
+                    return
+                async for chunk in response.content.iter_any():
+                    yield chunk
+
+        except asyncio.TimeoutError as e:
+            raise DifyTimeoutError("Request timeout") from e
+        except aiohttp.ClientConnectorError as e:
+            raise DifyConnectionError("Failed to connect to Dify API") from e
+        except aiohttp.ClientError as e:
+            raise DifyConnectionError(f"HTTP error: {str(e)}") from e
+
+    async def close(self) -> None:
+        """Close the HTTP client connections and cleanup resources."""
+        if self._client is not None:
+            await self._client.aclose()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncBaseClient":
+        """Enter async context manager.
+
+        Returns:
+            Self for method chaining
+        """
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit async context manager and cleanup resources.
+
+        Args:
+            exc_type: Exception type
+            exc_val: Exception value
+            exc_tb: Exception traceback
+        """
+        await self.close()
@@ -1,6 +1,6 @@
 """Base HTTP client for Dify API."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import httpx
 
@@ -15,6 +15,131 @@ from ._exceptions import (
     DifyTimeoutError,
     DifyValidationError,
 )
+from ._json import JSON_HEADERS, JSONItemParser, dumps, loads
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+
+
+def _default_headers(api_key: str) -> Dict[str, str]:
+    """Build the default headers for Dify API requests.
+
+    These are set once on the transport's session. Content-Type is left to
+    the transport, which sets it to match the encoded body (JSON or
+    multipart).
+
+    Args:
+        api_key: Dify API key for authentication
+
+    Returns:
+        Dictionary containing standard headers for Dify API requests
+    """
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "User-Agent": "dify-dataset-sdk/0.4.0",
+    }
+
+
+def _parse_error_body(content: bytes) -> Dict[str, Any]:
+    """Safely parse an error response body.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Parsed JSON data or empty dict if parsing fails
+    """
+    if not content:
+        return {}
+
+    try:
+        return loads(content)  # type: ignore[no-any-return]
+    except ValueError:
+        return {"message": "Failed to parse error response"}
+
+
+def _handle_status(status_code: int, content: bytes) -> Any:
+    """Map a status code and raw body to parsed data or a Dify exception.
+
+    Shared by the sync and async clients so both transports raise the
+    same exception types for the same responses.
+
+    Args:
+        status_code: HTTP status code
+        content: Raw response body
+
+    Returns:
+        Parsed JSON response data or success status
+
+    Raises:
+        DifyValidationError: For 400, 403, 413, 415 status codes
+        DifyAuthenticationError: For 401 status code
+        DifyNotFoundError: For 404 status code
+        DifyConflictError: For 409 status code
+        DifyServerError: For 5xx status codes
+        DifyAPIError: For other unexpected status codes
+    """
+    if status_code in (200, 201):
+        if content:
+            try:
+                return loads(content)
+            except ValueError as e:
+                raise DifyAPIError(f"Invalid JSON response: {str(e)}", status_code) from e
+        else:
+            return {}
+    elif status_code == 204:
+        return {"status": "success"}
+    elif status_code == 400:
+        error_data = _parse_error_body(content)
+        error_code = error_data.get("code", "unknown")
+        default_msg = error_data.get("message") or "Bad request"
+        message = ERROR_CODE_MAPPING.get(error_code) or default_msg
+        raise DifyValidationError(message, status_code, error_code)
+    elif status_code == 401:
+        raise DifyAuthenticationError("Invalid API key", status_code)
+    elif status_code == 403:
+        error_data = _parse_error_body(content)
+        error_code = error_data.get("code", "forbidden")
+        message = ERROR_CODE_MAPPING.get(error_code) or "Forbidden"
+        raise DifyValidationError(message, status_code, error_code)
+    elif status_code == 404:
+        raise DifyNotFoundError("Resource not found", status_code)
+    elif status_code == 409:
+        error_data = _parse_error_body(content)
+        error_code = error_data.get("code", "conflict")
+        message = ERROR_CODE_MAPPING.get(error_code) or "Conflict"
+        raise DifyConflictError(message, status_code, error_code)
+    elif status_code == 413:
+        raise DifyValidationError("File too large", status_code, "file_too_large")
+    elif status_code == 415:
+        raise DifyValidationError(
+            "Unsupported file type",
+            status_code,
+            "unsupported_file_type",
+        )
+    elif status_code >= 500:
+        raise DifyServerError("Server error", status_code)
+    else:
+        raise DifyAPIError(
+            f"Unexpected status code: {status_code}",
+            status_code,
+        )
+
+
+def _as_dict(body: Any) -> Dict[str, Any]:
+    """Normalize a decoded response body to a JSON object.
+
+    Some endpoints answer with a bare JSON array; those are wrapped as
+    ``{"data": body}`` so every caller can read ``response["data"]``
+    without checking the shape first.
+
+    Args:
+        body: Decoded response body
+
+    Returns:
+        The body itself if it is a dict, otherwise ``{"data": body}``
+    """
+    return body if isinstance(body, dict) else {"data": body}
 
 
 class BaseClient:
@@ -23,19 +148,36 @@ class BaseClient:
     Provides a foundation for making HTTP requests to the Dify API with
     proper error handling, timeout management, and authentication.
 
+    A single pooled ``httpx.Client`` is reused for all requests, so TLS
+    handshakes are paid once per connection rather than once per call, and
+    HTTP/2 (negotiated over TLS) multiplexes concurrent requests on one
+    connection.
+
     Attributes:
         api_key (str): API key for authentication
         base_url (str): Base URL for API endpoints
         timeout (float): Request timeout in seconds
     """
 
-    def __init__(self, api_key: str, base_url: str = "https://api.dify.ai", timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.dify.ai",
+        timeout: float = 30.0,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    ) -> None:
         """Initialize the base client.
 
         Args:
             api_key: Dify API key for authentication
             base_url: Base URL for the Dify API (default: https://api.dify.ai)
             timeout: Request timeout in seconds (default: 30.0)
+            http2: Enable HTTP/2 for HTTPS endpoints (default: True)
+            max_connections: Maximum number of pooled connections (default: 100)
+            max_keepalive_connections: Maximum number of idle connections kept
+                alive for reuse (default: 50)
 
         Raises:
             ValueError: If api_key is empty or None
@@ -45,7 +187,15 @@ class BaseClient:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self._client = httpx.Client(timeout=httpx.Timeout(timeout))
+        self._client = httpx.Client(
+            headers=self._get_headers(),
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=httpx.Timeout(timeout),
+        )
 
     def _safe_parse_error_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Safely parse error response JSON.
@@ -56,13 +206,7 @@ class BaseClient:
         Returns:
             Parsed JSON data or empty dict if parsing fails
         """
-        if not response.content:
-            return {}
-
-        try:
-            return response.json()  # type: ignore[no-any-return]
-        except ValueError:
-            return {"message": "Failed to parse error response"}
+        return _parse_error_body(response.content)
 
     def _get_headers(self) -> Dict[str, str]:
         """Get default headers for API requests.
@@ -70,20 +214,17 @@ class BaseClient:
         Returns:
             Dictionary containing standard headers for Dify API requests
         """
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "dify-dataset-sdk/0.4.0",
-        }
+        return _default_headers(self.api_key)
 
-    def _handle_response(self, response: httpx.Response) -> Any:
+    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Handle HTTP response and raise appropriate exceptions.
 
         Args:
             response: HTTP response object from httpx
 
         Returns:
-            Parsed JSON response data or success status
+            Parsed JSON object (bare arrays are wrapped as ``{"data": [...]}``)
+            or success status
 
         Raises:
             DifyValidationError: For 400, 403, 413, 415 status codes
@@ -95,51 +236,7 @@ class BaseClient:
             DifyConnectionError: For connection-related errors
         """
         try:
-            if response.status_code in (200, 201):
-                if response.content:
-                    try:
-                        return response.json()
-                    except ValueError as e:
-                        raise DifyAPIError(f"Invalid JSON response: {str(e)}", response.status_code) from e
-                else:
-                    return {}
-            elif response.status_code == 204:
-                return {"status": "success"}
-            elif response.status_code == 400:
-                error_data = self._safe_parse_error_response(response)
-                error_code = error_data.get("code", "unknown")
-                default_msg = error_data.get("message") or "Bad request"
-                message = ERROR_CODE_MAPPING.get(error_code) or default_msg
-                raise DifyValidationError(message, response.status_code, error_code)
-            elif response.status_code == 401:
-                raise DifyAuthenticationError("Invalid API key", response.status_code)
-            elif response.status_code == 403:
-                error_data = self._safe_parse_error_response(response)
-                error_code = error_data.get("code", "forbidden")
-                message = ERROR_CODE_MAPPING.get(error_code) or "Forbidden"
-                raise DifyValidationError(message, response.status_code, error_code)
-            elif response.status_code == 404:
-                raise DifyNotFoundError("Resource not found", response.status_code)
-            elif response.status_code == 409:
-                error_data = self._safe_parse_error_response(response)
-                error_code = error_data.get("code", "conflict")
-                message = ERROR_CODE_MAPPING.get(error_code) or "Conflict"
-                raise DifyConflictError(message, response.status_code, error_code)
-            elif response.status_code == 413:
-                raise DifyValidationError("File too large", response.status_code, "file_too_large")
-            elif response.status_code == 415:
-                raise DifyValidationError(
-                    "Unsupported file type",
-                    response.status_code,
-                    "unsupported_file_type",
-                )
-            elif response.status_code >= 500:
-                raise DifyServerError("Server error", response.status_code)
-            else:
-                raise DifyAPIError(
-                    f"Unexpected status code: {response.status_code}",
-                    response.status_code,
-                )
+            return _as_dict(_handle_status(response.status_code, response.content))
         except httpx.HTTPError as e:
             raise DifyConnectionError(f"Connection error: {str(e)}") from e
 
@@ -151,8 +248,22 @@ class BaseClient:
         params: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
     ) -> Any:
         """Make HTTP request."""
+        return self._request_with_status(method, path, json, params, files, data, content)[1]
+
+    def _request_with_status(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Make HTTP request and return the status code with the parsed body."""
         url = f"{self.base_url}{path}"
 
         try:
@@ -162,16 +273,12 @@ class BaseClient:
                 kwargs["files"] = files
                 if data:
                     kwargs["data"] = data
-                # Remove Content-Type header for multipart requests
-                headers = self._get_headers()
-                headers.pop("Content-Type", None)
-                kwargs["headers"] = headers
-            else:
-                kwargs["json"] = json
-                kwargs["headers"] = self._get_headers()
+            elif content is not None or json is not None:
+                kwargs["content"] = content if content is not None else dumps(json)
+                kwargs["headers"] = JSON_HEADERS
 
             response = self._client.request(**kwargs)
-            return self._handle_response(response)
+            return response.status_code, self._handle_response(response)
 
         except httpx.TimeoutException as e:
             raise DifyTimeoutError("Request timeout") from e
@@ -190,9 +297,13 @@ class BaseClient:
         json: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
     ) -> Any:
-        """Make POST request."""
-        return self._request("POST", path, json=json, files=files, data=data)
+        """Make POST request.
+
+        ``content`` sends an already encoded JSON body as is, in place of ``json``.
+        """
+        return self._request("POST", path, json=json, files=files, data=data, content=content)
 
     def patch(self, path: str, json: Optional[Dict[str, Any]] = None) -> Any:
         """Make PATCH request."""
@@ -202,6 +313,74 @@ class BaseClient:
         """Make DELETE request."""
         return self._request("DELETE", path, json=json)
 
+    def request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make request with an arbitrary HTTP method."""
+        return self._request(method, path, json=json, params=params)
+
+    def request_with_status(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Make request with an arbitrary HTTP method, returning (status code, body)."""
+        return self._request_with_status(method, path, json=json, params=params)
+
+    def stream_items(
+        self,
+        method: str,
+        path: str,
+        prefix: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """Make request and yield the JSON values at ``prefix`` as they arrive.
+
+        The body is parsed while it is downloaded, so a large array can be
+        consumed item by item without holding the whole document in memory.
+
+        Args:
+            method: HTTP method
+            path: Request path
+            prefix: ijson-style path of the values to yield, e.g.
+                ``"doc_metadata.item"``
+            params: Query parameters (optional)
+
+        Yields:
+            Decoded JSON values
+
+        Raises:
+            DifyAPIError: If the request fails or the body is not valid JSON
+            DifyTimeoutError: If the request times out
+            DifyConnectionError: For connection-related errors
+        """
+        url = f"{self.base_url}{path}"
+        try:
+            with self._client.stream(method, url, params=params) as response:
+                if response.status_code not in (200, 201):
+                    _handle_status(response.status_code, response.read())
+                    return
+                parser = JSONItemParser(prefix)
+                try:
+                    for chunk in response.iter_bytes():
+                        yield from parser.feed(chunk)
+                    yield from parser.close()
+                except ValueError as e:
+                    raise DifyAPIError(f"Invalid JSON response: {str(e)}", response.status_code) from e
+
+        except httpx.TimeoutException as e:
+            raise DifyTimeoutError("Request timeout") from e
+        except httpx.ConnectError as e:
+            raise DifyConnectionError("Failed to connect to Dify API") from e
+        except httpx.HTTPError as e:
+            raise DifyConnectionError(f"HTTP error: {str(e)}") from e
+
     def close(self) -> None:
         """Close the HTTP client connection and cleanup resources."""
         self._client.close()
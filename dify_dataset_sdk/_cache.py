@@ -0,0 +1,97 @@
+"""Small TTL + LRU cache for read-mostly list endpoints."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+DEFAULT_LIST_CACHE_TTL = 5.0
+
+
+class TTLCache:
+    """In-memory cache whose entries expire after a fixed time-to-live.
+
+    The least recently used entry is evicted once ``maxsize`` is reached.
+    A ``ttl`` of 0 or less disables caching entirely.
+
+    Every invalidation bumps a generation counter. A caller that reads
+    ``generation`` before fetching and passes it to ``set`` cannot store a
+    result that was fetched before a concurrent write invalidated the cache.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays fresh; 0 or less disables the cache
+            maxsize: Maximum number of entries kept (default: 128)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether values are cached at all."""
+        return self.ttl > 0
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented by every invalidation."""
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            generation: Generation read before fetching ``value``; the value
+                is dropped if the cache was invalidated since (optional)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry when ``key`` is None.
+
+        Args:
+            key: Cache key to drop (optional)
+        """
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
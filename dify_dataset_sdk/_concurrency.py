@@ -0,0 +1,169 @@
+"""Bounded-concurrency helpers shared by the bulk client methods."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = 20
+
+
+def _check_concurrency(concurrency: int) -> None:
+    """Validate a concurrency cap.
+
+    Args:
+        concurrency: Maximum number of requests in flight
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def map_limited(
+    func: Callable[[T], Any],
+    items: Iterable[T],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Call ``func`` for every item on a thread pool with at most ``concurrency`` workers.
+
+    Args:
+        func: Function to call for each item
+        items: Items to process
+        concurrency: Maximum number of calls in flight (default: 20)
+        return_exceptions: Return exceptions in place of results instead of
+            raising the first one (default: False)
+
+    Returns:
+        Results in the same order as ``items``
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    _check_concurrency(concurrency)
+    items = list(items)
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        results: List[Any] = []
+        try:
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return results
+
+
+async def gather_limited(
+    func: Callable[[T], Awaitable[Any]],
+    items: Iterable[T],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Await ``func`` for every item with at most ``concurrency`` calls in flight.
+
+    Unless ``return_exceptions`` is set, the first failure stops the batch, as
+    in ``map_limited``: calls that have not started yet are skipped, calls
+    still in flight are cancelled, and all of them have finished by the time
+    the exception reaches the caller.
+
+    Args:
+        func: Coroutine function to await for each item
+        items: Items to process
+        concurrency: Maximum number of calls in flight (default: 20)
+        return_exceptions: Return exceptions in place of results instead of
+            raising the first one, as in ``asyncio.gather`` (default: False)
+
+    Returns:
+        Results in the same order as ``items``
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    _check_concurrency(concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    failed = False
+
+    async def run(item: T) -> Any:
+        nonlocal failed
+        async with semaphore:
+            if failed:
+                return None
+            try:
+                return await func(item)
+            except Exception:
+                # Set before the semaphore is released, so no waiting call starts
+                if not return_exceptions:
+                    failed = True
+                raise
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks, return_exceptions=return_exceptions))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class SingleFlight:
+    """Coalesce identical concurrent async calls into one.
+
+    While a call for a key is in flight, further calls for the same key
+    await its result instead of starting their own. The key is forgotten as
+    soon as the call completes, so nothing is cached beyond that. Every
+    caller receives the same result object, so callers that hand it out
+    should copy mutable values.
+
+    Cancelling one waiting caller does not cancel the shared call for the
+    others.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._inflight: Dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Await ``func()``, sharing one call among concurrent callers of ``key``.
+
+        Args:
+            key: Identity of the call, e.g. ``("list", dataset_id)``
+            func: Coroutine function to run if no call for ``key`` is in flight
+
+        Returns:
+            Result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        """Drop a completed call and mark its exception as retrieved.
+
+        Args:
+            key: Key the call was registered under
+            future: Completed future
+        """
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,146 @@
+"""JSON (de)serialization used by the HTTP clients.
+
+Uses orjson when it is installed (``pip install "dify-dataset-sdk[speedups]"``)
+and falls back to the standard library otherwise. Streaming responses are
+parsed incrementally with ijson when it is installed
+(``pip install "dify-dataset-sdk[streaming]"``) and buffered otherwise.
+"""
+
+import json
+from typing import Any, Dict, Iterator, List, Sequence, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - depends on the environment
+    ijson = None
+
+# Headers sent with every pre-encoded JSON body
+JSON_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
+
+# Pre-encoded empty JSON object, for endpoints that expect an empty body
+EMPTY_JSON_OBJECT = b"{}"
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object as compact UTF-8 JSON.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON data.
+
+    Args:
+        data: Raw JSON bytes or text
+
+    Returns:
+        Decoded object
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _walk(obj: Any, parts: Sequence[str]) -> Iterator[Any]:
+    """Yield the values of a decoded document at an ijson-style prefix.
+
+    Args:
+        obj: Decoded JSON value
+        parts: Remaining prefix components; ``item`` descends into arrays
+
+    Yields:
+        Matching values
+    """
+    if not parts:
+        yield obj
+    elif parts[0] == "item":
+        if isinstance(obj, list):
+            for value in obj:
+                yield from _walk(value, parts[1:])
+    elif isinstance(obj, dict) and parts[0] in obj:
+        yield from _walk(obj[parts[0]], parts[1:])
+
+
+class JSONItemParser:
+    """Incrementally extract the values at a prefix from a JSON document.
+
+    Feed the raw body chunk by chunk; each call returns the values that were
+    completed by that chunk. Prefixes use the ijson syntax, e.g.
+    ``"doc_metadata.item"`` for every element of the ``doc_metadata`` array.
+    Without ijson the chunks are buffered and every value is returned by
+    ``close``.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        """Initialize the parser.
+
+        Args:
+            prefix: ijson-style path of the values to extract
+        """
+        self._prefix = prefix
+        self._chunks: List[bytes] = []
+        self._items: List[Any] = []
+        self._coro: Any = None
+        if ijson is not None:
+            self._items = ijson.sendable_list()
+            self._coro = ijson.items_coro(self._items, prefix, use_float=True)
+
+    def _drain(self) -> List[Any]:
+        """Return and forget the values completed so far."""
+        items = list(self._items)
+        del self._items[:]
+        return items
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Parse the next chunk of the document.
+
+        Args:
+            chunk: Raw bytes following the previous chunk
+
+        Returns:
+            Values completed by this chunk
+
+        Raises:
+            ValueError: If the data is not valid JSON
+        """
+        if self._coro is None:
+            self._chunks.append(chunk)
+            return []
+        try:
+            self._coro.send(chunk)
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        return self._drain()
+
+    def close(self) -> List[Any]:
+        """Finish parsing after the last chunk.
+
+        Returns:
+            Values not returned by ``feed`` yet
+
+        Raises:
+            ValueError: If the data is not valid, complete JSON
+        """
+        if self._coro is None:
+            return list(_walk(loads(b"".join(self._chunks)), self._prefix.split(".")))
+        try:
+            self._coro.close()
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        return self._drain()
@@ -2,13 +2,19 @@
 
 from typing import Any
 
-from ._base import BaseClient
+from ._async_base import AsyncBaseClient, AsyncTransport
+from ._base import (
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    BaseClient,
+)
+from ._cache import DEFAULT_LIST_CACHE_TTL
 from .datasets import DatasetsClient
 from .documents import DocumentsClient
+from .metadata import AsyncMetadataClient, MetadataClient
 from .models_api import ModelsClient
-from .metadata import MetadataClient
 from .segments import SegmentsClient
-from .tags import TagsClient
+from .tags import AsyncTagsClient, TagsClient
 
 
 class DifyDatasetClient:
@@ -59,6 +65,10 @@ class DifyDatasetClient:
         api_key: str,
         base_url: str = "https://api.dify.ai",
         timeout: float = 30.0,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        list_cache_ttl: float = DEFAULT_LIST_CACHE_TTL,
     ) -> None:
         """Initialize the Dify client.
 
@@ -66,16 +76,29 @@ class DifyDatasetClient:
             api_key: Dify API key for authentication
             base_url: Base URL for Dify API (default: https://api.dify.ai)
             timeout: Request timeout in seconds (default: 30.0)
+            http2: Enable HTTP/2 for HTTPS endpoints (default: True)
+            max_connections: Maximum number of pooled connections (default: 100)
+            max_keepalive_connections: Maximum number of idle connections kept
+                alive for reuse (default: 50)
+            list_cache_ttl: Seconds tag and metadata list results are reused;
+                0 disables caching (default: 5.0)
 
         Raises:
             ValueError: If api_key is empty or None
         """
-        self._base = BaseClient(api_key, base_url, timeout)
+        self._base = BaseClient(
+            api_key,
+            base_url,
+            timeout,
+            http2=http2,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
         self.datasets = DatasetsClient(self._base)
         self.documents = DocumentsClient(self._base)
         self.segments = SegmentsClient(self._base)
-        self.tags = TagsClient(self._base)
-        self.metadata = MetadataClient(self._base)
+        self.tags = TagsClient(self._base, list_cache_ttl)
+        self.metadata = MetadataClient(self._base, list_cache_ttl)
         self.models = ModelsClient(self._base)
 
     def close(self) -> None:
@@ -99,3 +122,96 @@ class DifyDatasetClient:
             exc_tb: Exception traceback
         """
         self.close()
+
+
+class AsyncDifyDatasetClient:
+    """Async Dify Knowledge Base API client for concurrent tag and metadata work.
+
+    Provides awaitable versions of the tag and metadata sub-clients on top
+    of a shared async HTTP client: httpx with HTTP/2 by default, or aiohttp
+    with ``transport="aiohttp"`` (``pip install "dify-dataset-sdk[async]"``).
+
+    - tags: Knowledge tag management
+    - metadata: Metadata field management
+
+    Example:
+        ```python
+        import asyncio
+
+        from dify_dataset_sdk import AsyncDifyDatasetClient
+
+        async def main() -> None:
+            async with AsyncDifyDatasetClient(api_key="your-api-key") as client:
+                tags = await asyncio.gather(
+                    *(client.tags.create(name=name) for name in ["A", "B", "C"])
+                )
+                fields = await client.metadata.list("dataset-id")
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.dify.ai",
+        timeout: float = 30.0,
+        transport: AsyncTransport = "httpx",
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        list_cache_ttl: float = DEFAULT_LIST_CACHE_TTL,
+    ) -> None:
+        """Initialize the async Dify client.
+
+        Args:
+            api_key: Dify API key for authentication
+            base_url: Base URL for Dify API (default: https://api.dify.ai)
+            timeout: Request timeout in seconds (default: 30.0)
+            transport: HTTP transport, 'httpx' or 'aiohttp' (default: 'httpx')
+            http2: Enable HTTP/2 for HTTPS endpoints; httpx transport only
+                (default: True)
+            max_connections: Maximum number of pooled connections (default: 100)
+            max_keepalive_connections: Maximum number of idle connections kept
+                alive for reuse; httpx transport only (default: 50)
+            list_cache_ttl: Seconds tag and metadata list results are reused;
+                0 disables caching (default: 5.0)
+
+        Raises:
+            ValueError: If api_key is empty or None, or transport is unknown
+            ImportError: If the aiohttp transport is requested but aiohttp is
+                not installed
+        """
+        self._base = AsyncBaseClient(
+            api_key,
+            base_url,
+            timeout,
+            transport=transport,
+            http2=http2,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.tags = AsyncTagsClient(self._base, list_cache_ttl)
+        self.metadata = AsyncMetadataClient(self._base, list_cache_ttl)
+
+    async def close(self) -> None:
+        """Close the HTTP session and cleanup resources."""
+        await self._base.close()
+
+    async def __aenter__(self) -> "AsyncDifyDatasetClient":
+        """Enter async context manager.
+
+        Returns:
+            Self for method chaining
+        """
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit async context manager and cleanup resources.
+
+        Args:
+            exc_type: Exception type
+            exc_val: Exception value
+            exc_tb: Exception traceback
+        """
+        await self.close()
@@ -1,5 +1,6 @@
 """Metadata module for Dify Dataset SDK."""
 
+from .async_client import AsyncMetadataClient
 from .client import MetadataClient
 from .models import (
     CreateMetadataRequest,
@@ -13,6 +14,7 @@ from .models import (
 
 __all__ = [
     "MetadataClient",
+    "AsyncMetadataClient",
     "Metadata",
     "MetadataValue",
     "DocumentMetadata",
@@ -0,0 +1,269 @@
+"""Async metadata client for Dify API."""
+
+from typing import Any, AsyncIterator, Dict, List, Literal, Mapping, Optional, Union
+
+from .._async_base import AsyncBaseClient
+from .._cache import DEFAULT_LIST_CACHE_TTL, TTLCache
+from .._concurrency import DEFAULT_CONCURRENCY, SingleFlight, gather_limited
+from .client import _copy_list_response, _document_metadata_body
+from .models import (
+    DocumentMetadata,
+    Metadata,
+    MetadataListResponse,
+)
+
+
+class AsyncMetadataClient:
+    """Async client for metadata management operations.
+
+    Mirrors MetadataClient with awaitable methods. Concurrent list() calls
+    for the same dataset share a single request.
+    """
+
+    def __init__(self, base_client: AsyncBaseClient, list_cache_ttl: float = DEFAULT_LIST_CACHE_TTL) -> None:
+        """Initialize the async metadata client.
+
+        Args:
+            base_client: Async HTTP client for making API requests
+            list_cache_ttl: Seconds list() results are reused per dataset before
+                being fetched again; 0 disables caching (default: 5.0)
+        """
+        self._client = base_client
+        self._cache = TTLCache(list_cache_ttl)
+        self._inflight = SingleFlight()
+
+    def invalidate_cache(self, dataset_id: Optional[str] = None) -> None:
+        """Drop cached list() results so the next call fetches fresh data.
+
+        Args:
+            dataset_id: Only drop the entry for this dataset (optional)
+        """
+        self._cache.invalidate(dataset_id)
+
+    async def create(
+        self,
+        dataset_id: str,
+        field_type: str,
+        name: str,
+    ) -> Metadata:
+        """Create a metadata field for a dataset.
+
+        Args:
+            dataset_id: Dataset ID
+            field_type: Metadata type (string, number, time)
+            name: Field name
+
+        Returns:
+            Created metadata field information
+
+        Raises:
+            DifyNotFoundError: If dataset not found
+            DifyValidationError: If field data is invalid
+            DifyAPIError: For other API errors
+        """
+        response = await self._client.post(
+            f"/v1/datasets/{dataset_id}/metadata",
+            json={"type": field_type, "name": name},
+        )
+        self._cache.invalidate(dataset_id)
+        return Metadata.model_validate(response)
+
+    async def update(
+        self,
+        dataset_id: str,
+        metadata_id: str,
+        name: str,
+    ) -> Metadata:
+        """Update a metadata field.
+
+        Args:
+            dataset_id: Dataset ID
+            metadata_id: Metadata field ID
+            name: Updated field name
+
+        Returns:
+            Updated metadata field information
+
+        Raises:
+            DifyNotFoundError: If dataset or metadata field not found
+            DifyValidationError: If field data is invalid
+            DifyAPIError: For other API errors
+        """
+        response = await self._client.patch(
+            f"/v1/datasets/{dataset_id}/metadata/{metadata_id}",
+            json={"name": name},
+        )
+        self._cache.invalidate(dataset_id)
+        return Metadata.model_validate(response)
+
+    async def delete(
+        self,
+        dataset_id: str,
+        metadata_id: str,
+    ) -> Dict[str, Any]:
+        """Delete a metadata field.
+
+        Args:
+            dataset_id: Dataset ID
+            metadata_id: Metadata field ID
+
+        Returns:
+            Success response
+
+        Raises:
+            DifyNotFoundError: If dataset or metadata field not found
+            DifyAPIError: For other API errors
+        """
+        result: Dict[str, Any] = await self._client.delete(f"/v1/datasets/{dataset_id}/metadata/{metadata_id}")
+        self._cache.invalidate(dataset_id)
+        return result
+
+    async def toggle_built_in(
+        self,
+        dataset_id: str,
+        action: Literal["disable", "enable"],
+    ) -> Dict[str, Any]:
+        """Enable or disable built-in metadata fields.
+
+        Args:
+            dataset_id: Dataset ID
+            action: Action to perform - 'disable' or 'enable'
+
+        Returns:
+            Success response
+
+        Raises:
+            DifyNotFoundError: If dataset not found
+            DifyValidationError: If action is invalid
+            DifyAPIError: For other API errors
+        """
+        result: Dict[str, Any] = await self._client.post(f"/v1/datasets/{dataset_id}/metadata/built-in/{action}")
+        self._cache.invalidate(dataset_id)
+        return result
+
+    async def update_document_metadata(
+        self,
+        dataset_id: str,
+        operation_data: Union[List[DocumentMetadata], List[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Update document metadata values.
+
+        Args:
+            dataset_id: Dataset ID
+            operation_data: List of document metadata operations, each containing:
+                - document_id (str): Document ID
+                - metadata_list (list): Metadata list with id, value, name
+
+        Returns:
+            Success response
+
+        Raises:
+            DifyNotFoundError: If dataset not found
+            DifyValidationError: If metadata is invalid
+            DifyAPIError: For other API errors
+        """
+        result: Dict[str, Any] = await self._client.post(
+            f"/v1/datasets/{dataset_id}/documents/metadata",
+            content=_document_metadata_body(operation_data),
+        )
+        self._cache.invalidate(dataset_id)
+        return result
+
+    async def update_document_metadata_many(
+        self,
+        operation_data_by_dataset: Mapping[str, Union[List[DocumentMetadata], List[Dict[str, Any]]]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Update document metadata values across several datasets concurrently.
+
+        Args:
+            operation_data_by_dataset: Mapping of dataset ID to its document
+                metadata operations, as accepted by update_document_metadata
+            concurrency: Maximum number of requests in flight (default: 20)
+            return_exceptions: Return per-item exceptions in place of results
+                instead of raising the first failure (default: False)
+
+        Returns:
+            Success responses in the mapping's iteration order
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            DifyNotFoundError: If a dataset is not found (unless return_exceptions)
+            DifyValidationError: If metadata is invalid (unless return_exceptions)
+            DifyAPIError: For other API errors (unless return_exceptions)
+        """
+        return await gather_limited(
+            lambda item: self.update_document_metadata(*item),
+            operation_data_by_dataset.items(),
+            concurrency,
+            return_exceptions,
+        )
+
+    async def list(self, dataset_id: str) -> MetadataListResponse:
+        """Get list of metadata fields for a dataset.
+
+        Results are reused for ``list_cache_ttl`` seconds and refreshed after
+        any metadata change to the dataset made through this client.
+        Concurrent calls for the same dataset share one request, unless a
+        metadata change made through this client finished in between.
+
+        Args:
+            dataset_id: Dataset ID
+
+        Returns:
+            List of metadata fields
+
+        Raises:
+            DifyNotFoundError: If dataset not found
+            DifyAPIError: For other API errors
+        """
+        cached: Optional[MetadataListResponse] = self._cache.get(dataset_id)
+        if cached is None:
+            # Keyed by generation so calls made after a write never join a
+            # fetch that started before it
+            generation = self._cache.generation
+            cached = await self._inflight.do(
+                (dataset_id, generation),
+                lambda: self._fetch_list(dataset_id, generation),
+            )
+        return _copy_list_response(cached)
+
+    async def _fetch_list(self, dataset_id: str, generation: int) -> MetadataListResponse:
+        """Fetch the metadata fields of a dataset and store them in the cache.
+
+        Args:
+            dataset_id: Dataset ID
+            generation: Cache generation read before the fetch started
+
+        Returns:
+            List of metadata fields
+        """
+        response = await self._client.get(f"/v1/datasets/{dataset_id}/metadata")
+        result = MetadataListResponse.model_validate(response)
+        self._cache.set(dataset_id, result, generation)
+        return result
+
+    async def iter_list(self, dataset_id: str) -> AsyncIterator[Metadata]:
+        """Iterate over the metadata fields of a dataset as they are received.
+
+        Use with ``async for``. The response is parsed while it is downloaded, so the first fields
+        are available before the whole body has arrived and datasets with
+        thousands of fields are never held in memory at once. Unlike list(),
+        results are not cached and the other response fields (such as
+        built_in_field_enabled) are not returned. Install the ``streaming``
+        extra for incremental parsing; without it the body is buffered.
+
+        Args:
+            dataset_id: Dataset ID
+
+        Yields:
+            Metadata fields in response order
+
+        Raises:
+            DifyNotFoundError: If dataset not found
+            DifyAPIError: For other API errors
+        """
+        async for item in self._client.stream_items("GET", f"/v1/datasets/{dataset_id}/metadata", "doc_metadata.item"):
+            yield Metadata.model_validate(item)
@@ -1,28 +1,69 @@
 """Metadata client for Dify API."""
 
-from typing import Any, Dict, List, Literal, Union
+from typing import Any, Dict, Iterator, List, Literal, Mapping, Optional, Union
 
 from .._base import BaseClient
+from .._cache import DEFAULT_LIST_CACHE_TTL, TTLCache
+from .._concurrency import DEFAULT_CONCURRENCY, map_limited
 from .models import (
-    CreateMetadataRequest,
+    _DOC_META_ADAPTER,
     DocumentMetadata,
     Metadata,
     MetadataListResponse,
-    UpdateDocumentMetadataRequest,
-    UpdateMetadataRequest,
 )
 
 
+def _document_metadata_body(
+    operation_data: Union[List[DocumentMetadata], List[Dict[str, Any]]],
+) -> bytes:
+    """Validate document metadata operations and encode the request body.
+
+    The whole list is validated and serialized by pydantic-core in one call
+    each, without building an intermediate list of dicts.
+
+    Args:
+        operation_data: DocumentMetadata instances or equivalent dicts
+
+    Returns:
+        Encoded ``{"operation_data": [...]}`` JSON body
+    """
+    converted_data = _DOC_META_ADAPTER.validate_python(operation_data)
+    return b'{"operation_data":' + _DOC_META_ADAPTER.dump_json(converted_data) + b"}"
+
+
+def _copy_list_response(response: MetadataListResponse) -> MetadataListResponse:
+    """Copy a cached list response so callers cannot mutate the cached one.
+
+    Args:
+        response: Cached response
+
+    Returns:
+        Copy with its own field list (the frozen Metadata items are shared)
+    """
+    return response.model_copy(update={"doc_metadata": list(response.doc_metadata)})
+
+
 class MetadataClient:
     """Client for metadata management operations."""
 
-    def __init__(self, base_client: BaseClient) -> None:
+    def __init__(self, base_client: BaseClient, list_cache_ttl: float = DEFAULT_LIST_CACHE_TTL) -> None:
         """Initialize the metadata client.
 
         Args:
             base_client: Base HTTP client for making API requests
+            list_cache_ttl: Seconds list() results are reused per dataset before
+                being fetched again; 0 disables caching (default: 5.0)
         """
         self._client = base_client
+        self._cache = TTLCache(list_cache_ttl)
+
+    def invalidate_cache(self, dataset_id: Optional[str] = None) -> None:
+        """Drop cached list() results so the next call fetches fresh data.
+
+        Args:
+            dataset_id: Only drop the entry for this dataset (optional)
+        """
+        self._cache.invalidate(dataset_id)
 
     def create(
         self,
@@ -45,12 +86,12 @@ class MetadataClient:
             DifyValidationError: If field data is invalid
             DifyAPIError: For other API errors
         """
-        request = CreateMetadataRequest(type=field_type, name=name)
         response = self._client.post(
             f"/v1/datasets/{dataset_id}/metadata",
-            json=request.model_dump(),
+            json={"type": field_type, "name": name},
         )
-        return Metadata(**response)
+        self._cache.invalidate(dataset_id)
+        return Metadata.model_validate(response)
 
     def update(
         self,
@@ -73,12 +114,12 @@ class MetadataClient:
             DifyValidationError: If field data is invalid
             DifyAPIError: For other API errors
         """
-        request = UpdateMetadataRequest(name=name)
         response = self._client.patch(
             f"/v1/datasets/{dataset_id}/metadata/{metadata_id}",
-            json=request.model_dump(),
+            json={"name": name},
         )
-        return Metadata(**response)
+        self._cache.invalidate(dataset_id)
+        return Metadata.model_validate(response)
 
     def delete(
         self,
@@ -98,7 +139,9 @@ class MetadataClient:
             DifyNotFoundError: If dataset or metadata field not found
             DifyAPIError: For other API errors
         """
-        return self._client.delete(f"/v1/datasets/{dataset_id}/metadata/{metadata_id}")
+        result: Dict[str, Any] = self._client.delete(f"/v1/datasets/{dataset_id}/metadata/{metadata_id}")
+        self._cache.invalidate(dataset_id)
+        return result
 
     def toggle_built_in(
         self,
@@ -119,7 +162,9 @@ class MetadataClient:
             DifyValidationError: If action is invalid
             DifyAPIError: For other API errors
         """
-        return self._client.post(f"/v1/datasets/{dataset_id}/metadata/built-in/{action}")
+        result: Dict[str, Any] = self._client.post(f"/v1/datasets/{dataset_id}/metadata/built-in/{action}")
+        self._cache.invalidate(dataset_id)
+        return result
 
     def update_document_metadata(
         self,
@@ -142,22 +187,51 @@ class MetadataClient:
             DifyValidationError: If metadata is invalid
             DifyAPIError: For other API errors
         """
-        converted_data: List[DocumentMetadata] = []
-        for item in operation_data:
-            if isinstance(item, dict):
-                converted_data.append(DocumentMetadata(**item))
-            else:
-                converted_data.append(item)
-        request = UpdateDocumentMetadataRequest(operation_data=converted_data)
         result: Dict[str, Any] = self._client.post(
             f"/v1/datasets/{dataset_id}/documents/metadata",
-            json=request.model_dump(),
+            content=_document_metadata_body(operation_data),
         )
+        self._cache.invalidate(dataset_id)
         return result
 
+    def update_document_metadata_many(
+        self,
+        operation_data_by_dataset: Mapping[str, Union[List[DocumentMetadata], List[Dict[str, Any]]]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Update document metadata values across several datasets concurrently.
+
+        Args:
+            operation_data_by_dataset: Mapping of dataset ID to its document
+                metadata operations, as accepted by update_document_metadata
+            concurrency: Maximum number of requests in flight (default: 20)
+            return_exceptions: Return per-item exceptions in place of results
+                instead of raising the first failure (default: False)
+
+        Returns:
+            Success responses in the mapping's iteration order
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            DifyNotFoundError: If a dataset is not found (unless return_exceptions)
+            DifyValidationError: If metadata is invalid (unless return_exceptions)
+            DifyAPIError: For other API errors (unless return_exceptions)
+        """
+        return map_limited(
+            lambda item: self.update_document_metadata(*item),
+            operation_data_by_dataset.items(),
+            concurrency,
+            return_exceptions,
+        )
+
     def list(self, dataset_id: str) -> MetadataListResponse:
         """Get list of metadata fields for a dataset.
 
+        Results are reused for ``list_cache_ttl`` seconds and refreshed after
+        any metadata change to the dataset made through this client.
+
         Args:
             dataset_id: Dataset ID
 
@@ -168,5 +242,33 @@ class MetadataClient:
             DifyNotFoundError: If dataset not found
             DifyAPIError: For other API errors
         """
-        response = self._client.get(f"/v1/datasets/{dataset_id}/metadata")
-        return MetadataListResponse(**response)
+        cached = self._cache.get(dataset_id)
+        if cached is None:
+            generation = self._cache.generation
+            response = self._client.get(f"/v1/datasets/{dataset_id}/metadata")
+            cached = MetadataListResponse.model_validate(response)
+            self._cache.set(dataset_id, cached, generation)
+        return _copy_list_response(cached)
+
+    def iter_list(self, dataset_id: str) -> Iterator[Metadata]:
+        """Iterate over the metadata fields of a dataset as they are received.
+
+        The response is parsed while it is downloaded, so the first fields
+        are available before the whole body has arrived and datasets with
+        thousands of fields are never held in memory at once. Unlike list(),
+        results are not cached and the other response fields (such as
+        built_in_field_enabled) are not returned. Install the ``streaming``
+        extra for incremental parsing; without it the body is buffered.
+
+        Args:
+            dataset_id: Dataset ID
+
+        Yields:
+            Metadata fields in response order
+
+        Raises:
+            DifyNotFoundError: If dataset not found
+            DifyAPIError: For other API errors
+        """
+        for item in self._client.stream_items("GET", f"/v1/datasets/{dataset_id}/metadata", "doc_metadata.item"):
+            yield Metadata.model_validate(item)
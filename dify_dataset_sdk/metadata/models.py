@@ -2,13 +2,13 @@
 
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class Metadata(BaseModel):
     """Metadata field information."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     id: str = Field(description="Metadata field ID")
     type: str = Field(description="Field type")
@@ -19,7 +19,7 @@ class Metadata(BaseModel):
 class MetadataValue(BaseModel):
     """Metadata value information."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     id: str = Field(description="Metadata field ID")
     value: str = Field(description="Metadata value")
@@ -35,6 +35,11 @@ class DocumentMetadata(BaseModel):
     metadata_list: List[MetadataValue] = Field(description="Metadata values")
 
 
+# Validates and dumps a whole operation_data list in one pydantic-core call;
+# accepts DocumentMetadata instances and plain dicts alike.
+_DOC_META_ADAPTER: TypeAdapter[List[DocumentMetadata]] = TypeAdapter(List[DocumentMetadata])
+
+
 class CreateMetadataRequest(BaseModel):
     """Request model for creating metadata field."""
 
@@ -1,7 +1,16 @@
-"""Tags module for Dify Dataset SDK."""
+"""Tags module for Dify Dataset SDK.
 
-from .client import TagsClient
+AsyncTagsClient runs many small requests concurrently, which is where the
+event loop's own overhead shows. Call ``dify_dataset_sdk.enable_uvloop()``
+once before ``asyncio.run`` to use uvloop (winloop on Windows) if installed.
+"""
+
+from ._fast import FastKnowledgeTag
+from .async_client import AsyncFastTagsClient, AsyncTagsClient
+from .client import FastTagsClient, TagsClient
 from .models import (
+    BatchOp,
+    BatchResult,
     BindDatasetToTagRequest,
     CreateKnowledgeTagRequest,
     DatasetTagsResponse,
@@ -13,11 +22,17 @@ from .models import (
 
 __all__ = [
     "TagsClient",
+    "AsyncTagsClient",
+    "FastTagsClient",
+    "AsyncFastTagsClient",
     "KnowledgeTag",
+    "FastKnowledgeTag",
     "CreateKnowledgeTagRequest",
     "UpdateKnowledgeTagRequest",
     "DeleteKnowledgeTagRequest",
     "BindDatasetToTagRequest",
     "UnbindDatasetFromTagRequest",
     "DatasetTagsResponse",
+    "BatchOp",
+    "BatchResult",
 ]
@@ -0,0 +1,96 @@
+"""Helpers shared by the sync and async tag batch methods."""
+
+from typing import Any, Dict, List, Sequence
+
+from .._base import _as_dict, _handle_status
+from .._exceptions import DifyAPIError, DifyError
+from .._json import dumps
+from .models import BatchOp, BatchResult
+
+# Status codes that mean the server has no batch endpoint at the given path
+BATCH_UNSUPPORTED_STATUS = (404, 405, 501)
+
+
+def build_pipeline(ops: Sequence[BatchOp]) -> Dict[str, Any]:
+    """Serialize operations into a batch-requests pipeline payload.
+
+    Args:
+        ops: Operations to send
+
+    Returns:
+        Payload in the APISIX ``batch-requests`` format
+    """
+    pipeline = []
+    for op in ops:
+        item: Dict[str, Any] = {"method": op.method, "path": op.path}
+        if op.body is not None:
+            item["body"] = dumps(op.body).decode("utf-8")
+        pipeline.append(item)
+    return {"pipeline": pipeline}
+
+
+def parse_pipeline(response: Any, ops: Sequence[BatchOp]) -> List[BatchResult]:
+    """Parse a batch-requests response into one result per operation.
+
+    Args:
+        response: Decoded response body, with the list of sub-responses
+            under ``data``
+        ops: Operations that were sent, in order
+
+    Returns:
+        Results in operation order
+
+    Raises:
+        DifyAPIError: If the response is not a list with one sub-response
+            object per operation, or a sub-response has a non-integer
+            status or a body that is neither a string nor an object
+    """
+    items = response.get("data") if isinstance(response, dict) else None
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise DifyAPIError("Invalid batch response: expected a list of sub-responses")
+    if len(items) != len(ops):
+        raise DifyAPIError(f"Invalid batch response: got {len(items)} results for {len(ops)} operations")
+    for item in items:
+        status = item.get("status")
+        if not isinstance(status, int) or isinstance(status, bool):
+            raise DifyAPIError(f"Invalid batch response: status {status!r} is not an integer")
+        if not isinstance(item.get("body"), (str, dict, type(None))):
+            raise DifyAPIError("Invalid batch response: body must be a string or an object")
+
+    results = []
+    for item in items:
+        status_code = item["status"]
+        body = item.get("body") or ""
+        try:
+            data = _as_dict(_handle_status(status_code, body.encode() if isinstance(body, str) else dumps(body)))
+        except DifyAPIError as e:
+            results.append(BatchResult(status_code=status_code, error=e.message, error_code=e.error_code))
+        else:
+            results.append(BatchResult(status_code=status_code, data=data))
+    return results
+
+
+def result_from_error(error: DifyError) -> BatchResult:
+    """Build a failed result from an exception raised by a single call.
+
+    Args:
+        error: Exception raised while running the operation
+
+    Returns:
+        Failed batch result
+    """
+    if isinstance(error, DifyAPIError):
+        return BatchResult(status_code=error.status_code, error=error.message, error_code=error.error_code)
+    return BatchResult(error=error.message)
+
+
+def is_batch_unsupported(error: DifyAPIError) -> bool:
+    """Whether an error from the batch endpoint means it does not exist.
+
+    Args:
+        error: Error raised by the batch request
+
+    Returns:
+        True when the caller should fall back to one request per operation
+    """
+    return error.status_code in BATCH_UNSUPPORTED_STATUS
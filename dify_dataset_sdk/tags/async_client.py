@@ -0,0 +1,484 @@
+"""Async tags client for Dify API."""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from .._async_base import AsyncBaseClient
+from .._cache import DEFAULT_LIST_CACHE_TTL, TTLCache
+from .._concurrency import DEFAULT_CONCURRENCY, SingleFlight, gather_limited
+from .._exceptions import DifyAPIError, DifyError
+from .._json import EMPTY_JSON_OBJECT
+from ._batch import (
+    build_pipeline,
+    is_batch_unsupported,
+    parse_pipeline,
+    result_from_error,
+)
+from ._fast import FastKnowledgeTag, parse_fast_tags
+from .models import (
+    _TAG_LIST_ADAPTER,
+    BatchOp,
+    BatchResult,
+    CreateKnowledgeTagRequest,
+    DatasetTagsResponse,
+    KnowledgeTag,
+    UpdateKnowledgeTagRequest,
+    _check_tag_name,
+)
+
+_TAGS_CACHE_KEY = "tags"
+_FAST_TAGS_CACHE_KEY = "tags_fast"
+
+
+class AsyncFastTagsClient:
+    """Async read-only tag queries that skip response validation.
+
+    Mirrors FastTagsClient with awaitable methods. Reached as
+    ``client.tags.fast``; shares the list cache and request coalescing
+    with it.
+    """
+
+    def __init__(self, base_client: AsyncBaseClient, cache: TTLCache, inflight: SingleFlight) -> None:
+        """Initialize the async fast tags client.
+
+        Args:
+            base_client: Async HTTP client for making API requests
+            cache: List cache shared with the owning AsyncTagsClient
+            inflight: Request coalescing shared with the owning AsyncTagsClient
+        """
+        self._client = base_client
+        self._cache = cache
+        self._inflight = inflight
+
+    async def list(self) -> List[FastKnowledgeTag]:
+        """Get list of knowledge type tags without validating them.
+
+        Cached and coalesced like AsyncTagsClient.list().
+
+        Returns:
+            List of knowledge tags
+
+        Raises:
+            DifyAPIError: For API errors
+        """
+        tags: Optional[List[FastKnowledgeTag]] = self._cache.get(_FAST_TAGS_CACHE_KEY)
+        if tags is None:
+            generation = self._cache.generation
+            tags = await self._inflight.do(
+                (_FAST_TAGS_CACHE_KEY, generation),
+                lambda: self._fetch_tags(generation),
+            )
+        return list(tags)
+
+    async def _fetch_tags(self, generation: int) -> List[FastKnowledgeTag]:
+        """Fetch the tag list and store it in the cache.
+
+        Args:
+            generation: Cache generation read before the fetch started
+
+        Returns:
+            List of knowledge tags
+        """
+        response = await self._client.get("/v1/datasets/tags")
+        tags = parse_fast_tags(response.get("data", []))
+        self._cache.set(_FAST_TAGS_CACHE_KEY, tags, generation)
+        return tags
+
+    async def get_dataset_tags(self, dataset_id: str) -> List[FastKnowledgeTag]:
+        """Get tags bound to a dataset without validating them.
+
+        Concurrent calls for the same dataset share one request.
+
+        Args:
+            dataset_id: Dataset ID
+
+        Returns:
+            List of bound tags
+
+        Raises:
+            DifyNotFoundError: If dataset not found
+            DifyAPIError: For other API errors
+        """
+        tags = await self._inflight.do(
+            ("fast_dataset_tags", dataset_id, self._cache.generation),
+            lambda: self._fetch_dataset_tags(dataset_id),
+        )
+        return list(tags)
+
+    async def _fetch_dataset_tags(self, dataset_id: str) -> List[FastKnowledgeTag]:
+        """Fetch the tags bound to a dataset.
+
+        Args:
+            dataset_id: Dataset ID
+
+        Returns:
+            Bound tags
+        """
+        response = await self._client.post(f"/v1/datasets/{dataset_id}/tags", content=EMPTY_JSON_OBJECT)
+        return parse_fast_tags(response.get("data", []))
+
+
+class AsyncTagsClient:
+    """Async client for tag management operations.
+
+    Mirrors TagsClient with awaitable methods, so many tag operations can
+    run concurrently on one event loop:
+
+    ```python
+    tags = await asyncio.gather(*(client.tags.create(name) for name in names))
+    ```
+
+    Identical reads issued concurrently (list() and get_dataset_tags() for
+    the same dataset) share a single request. ``fast`` offers the same reads
+    returning unvalidated FastKnowledgeTag tuples.
+    """
+
+    def __init__(self, base_client: AsyncBaseClient, list_cache_ttl: float = DEFAULT_LIST_CACHE_TTL) -> None:
+        """Initialize the async tags client.
+
+        Args:
+            base_client: Async HTTP client for making API requests
+            list_cache_ttl: Seconds list() results are reused before being
+                fetched again; 0 disables caching (default: 5.0)
+        """
+        self._client = base_client
+        self._cache = TTLCache(list_cache_ttl)
+        self._unsupported_batch_endpoints: Set[str] = set()
+        self._inflight = SingleFlight()
+        self.fast = AsyncFastTagsClient(base_client, self._cache, self._inflight)
+
+    def invalidate_cache(self) -> None:
+        """Drop cached list() results so the next call fetches fresh data."""
+        self._cache.invalidate()
+
+    # ===== Knowledge Tag Operations =====
+    async def create(self, name: str) -> KnowledgeTag:
+        """Create a new knowledge type tag.
+
+        Args:
+            name: Tag name (max 50 characters)
+
+        Returns:
+            Created tag information
+
+        Raises:
+            ValidationError: If name is not a string or longer than 50 characters
+            DifyValidationError: If the API rejects the name
+            DifyAPIError: For other API errors
+        """
+        name = _check_tag_name(CreateKnowledgeTagRequest, name=name)
+        response = await self._client.post("/v1/datasets/tags", json={"name": name})
+        self._cache.invalidate()
+        return KnowledgeTag.model_validate(response)
+
+    async def list(self) -> List[KnowledgeTag]:
+        """Get list of knowledge type tags.
+
+        Results are reused for ``list_cache_ttl`` seconds and refreshed after
+        any tag change made through this client. Concurrent calls share one
+        request, unless a tag change finished in between.
+
+        Returns:
+            List of knowledge tags
+
+        Raises:
+            DifyAPIError: For API errors
+        """
+        tags: Optional[List[KnowledgeTag]] = self._cache.get(_TAGS_CACHE_KEY)
+        if tags is None:
+            # Keyed by generation so calls made after a write never join a
+            # fetch that started before it
+            generation = self._cache.generation
+            tags = await self._inflight.do(
+                (_TAGS_CACHE_KEY, generation),
+                lambda: self._fetch_tags(generation),
+            )
+        return list(tags)
+
+    async def _fetch_tags(self, generation: int) -> List[KnowledgeTag]:
+        """Fetch the tag list and store it in the cache.
+
+        Args:
+            generation: Cache generation read before the fetch started
+
+        Returns:
+            List of knowledge tags
+        """
+        response = await self._client.get("/v1/datasets/tags")
+        tags = _TAG_LIST_ADAPTER.validate_python(response.get("data", []))
+        self._cache.set(_TAGS_CACHE_KEY, tags, generation)
+        return tags
+
+    async def update(self, tag_id: str, name: str) -> KnowledgeTag:
+        """Update knowledge type tag name.
+
+        Args:
+            tag_id: Tag ID
+            name: New tag name (max 50 characters)
+
+        Returns:
+            Updated tag information
+
+        Raises:
+            ValidationError: If name is not a string or longer than 50 characters
+            DifyNotFoundError: If tag not found
+            DifyValidationError: If the API rejects the name
+            DifyAPIError: For other API errors
+        """
+        name = _check_tag_name(UpdateKnowledgeTagRequest, name=name, tag_id=tag_id)
+        response = await self._client.patch("/v1/datasets/tags", json={"name": name, "tag_id": tag_id})
+        self._cache.invalidate()
+        return KnowledgeTag.model_validate(response)
+
+    async def delete(self, tag_id: str) -> Dict[str, Any]:
+        """Delete a knowledge type tag.
+
+        Args:
+            tag_id: Tag ID
+
+        Returns:
+            Success response
+
+        Raises:
+            DifyNotFoundError: If tag not found
+            DifyAPIError: For other API errors
+        """
+        result: Dict[str, Any] = await self._client.delete("/v1/datasets/tags", json={"tag_id": tag_id})
+        self._cache.invalidate()
+        return result
+
+    async def bind_to_dataset(
+        self,
+        dataset_id: str,
+        tag_ids: List[str],
+    ) -> Dict[str, Any]:
+        """Bind dataset to knowledge type tags.
+
+        Args:
+            dataset_id: Dataset ID
+            tag_ids: List of tag IDs
+
+        Returns:
+            Success response
+
+        Raises:
+            DifyNotFoundError: If dataset or tags not found
+            DifyValidationError: If tag IDs are invalid
+            DifyAPIError: For other API errors
+        """
+        result: Dict[str, Any] = await self._client.post(
+            "/v1/datasets/tags/binding",
+            json={"tag_ids": tag_ids, "target_id": dataset_id},
+        )
+        self._cache.invalidate()
+        return result
+
+    async def unbind_from_dataset(
+        self,
+        dataset_id: str,
+        tag_id: str,
+    ) -> Dict[str, Any]:
+        """Unbind dataset from knowledge type tag.
+
+        Args:
+            dataset_id: Dataset ID
+            tag_id: Tag ID
+
+        Returns:
+            Success response
+
+        Raises:
+            DifyNotFoundError: If dataset or tag not found
+            DifyAPIError: For other API errors
+        """
+        result: Dict[str, Any] = await self._client.post(
+            "/v1/datasets/tags/unbinding",
+            json={"tag_id": tag_id, "target_id": dataset_id},
+        )
+        self._cache.invalidate()
+        return result
+
+    async def get_dataset_tags(
+        self,
+        dataset_id: str,
+        return_detail: bool = False,
+    ) -> Union[List[KnowledgeTag], DatasetTagsResponse]:
+        """Get tags bound to a dataset.
+
+        Concurrent calls for the same dataset share one request, unless a tag
+        change made through this client finished in between.
+
+        Args:
+            dataset_id: Dataset ID
+            return_detail: Whether to return full response with total count
+
+        Returns:
+            List of bound tags, or full response when return_detail is True
+
+        Raises:
+            DifyNotFoundError: If dataset not found
+            DifyAPIError: For other API errors
+        """
+        tags, total = await self._inflight.do(
+            ("dataset_tags", dataset_id, self._cache.generation),
+            lambda: self._fetch_dataset_tags(dataset_id),
+        )
+        if return_detail:
+            return DatasetTagsResponse(data=list(tags), total=total)
+        return list(tags)
+
+    async def _fetch_dataset_tags(self, dataset_id: str) -> Tuple[List[KnowledgeTag], int]:
+        """Fetch the tags bound to a dataset.
+
+        Args:
+            dataset_id: Dataset ID
+
+        Returns:
+            Bound tags and their total count
+        """
+        response = await self._client.post(f"/v1/datasets/{dataset_id}/tags", content=EMPTY_JSON_OBJECT)
+        tags = _TAG_LIST_ADAPTER.validate_python(response.get("data", []))
+        return tags, response.get("total", len(tags))
+
+    # ===== Bulk Operations =====
+    async def create_many(
+        self,
+        names: Sequence[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[KnowledgeTag, BaseException]]:
+        """Create several knowledge type tags concurrently.
+
+        Args:
+            names: Tag names (max 50 characters each)
+            concurrency: Maximum number of requests in flight (default: 20)
+            return_exceptions: Return per-item exceptions in place of results
+                instead of raising the first failure (default: False)
+
+        Returns:
+            Created tags in the same order as ``names``
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            ValidationError: If a name is not a string or too long (unless return_exceptions)
+            DifyValidationError: If the API rejects a name (unless return_exceptions)
+            DifyAPIError: For other API errors (unless return_exceptions)
+        """
+        return await gather_limited(self.create, names, concurrency, return_exceptions)
+
+    async def delete_many(
+        self,
+        tag_ids: Sequence[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Delete several knowledge type tags concurrently.
+
+        Args:
+            tag_ids: Tag IDs
+            concurrency: Maximum number of requests in flight (default: 20)
+            return_exceptions: Return per-item exceptions in place of results
+                instead of raising the first failure (default: False)
+
+        Returns:
+            Success responses in the same order as ``tag_ids``
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            DifyNotFoundError: If a tag is not found (unless return_exceptions)
+            DifyAPIError: For other API errors (unless return_exceptions)
+        """
+        return await gather_limited(self.delete, tag_ids, concurrency, return_exceptions)
+
+    async def bind_many(
+        self,
+        tag_ids_by_dataset: Mapping[str, List[str]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Bind several datasets to knowledge type tags concurrently.
+
+        Args:
+            tag_ids_by_dataset: Mapping of dataset ID to the tag IDs to bind
+            concurrency: Maximum number of requests in flight (default: 20)
+            return_exceptions: Return per-item exceptions in place of results
+                instead of raising the first failure (default: False)
+
+        Returns:
+            Success responses in the mapping's iteration order
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            DifyNotFoundError: If a dataset or tag is not found (unless return_exceptions)
+            DifyAPIError: For other API errors (unless return_exceptions)
+        """
+        return await gather_limited(
+            lambda item: self.bind_to_dataset(*item),
+            tag_ids_by_dataset.items(),
+            concurrency,
+            return_exceptions,
+        )
+
+    # ===== Batch Operations =====
+    async def batch(
+        self,
+        ops: Sequence[BatchOp],
+        *,
+        batch_endpoint: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> List[BatchResult]:
+        """Run several tag API calls as one batch.
+
+        When ``batch_endpoint`` points at a batch-requests gateway in front of
+        Dify (e.g. APISIX ``/v1/batch``), all operations are sent in a single
+        HTTP request. Dify itself has no batch endpoint, so by default, and
+        once the endpoint has answered 404/405/501, the operations are
+        dispatched concurrently as individual requests instead.
+
+        Args:
+            ops: Operations to run, e.g.
+                ``BatchOp(method="POST", path="/v1/datasets/tags",
+                body=CreateKnowledgeTagRequest(name="A").model_dump())``
+            batch_endpoint: Path of a batch-requests endpoint (optional)
+            concurrency: Maximum number of requests in flight when dispatching
+                individually (default: 20)
+
+        Returns:
+            One result per operation, in order. Failures of individual
+            operations are reported in the result instead of being raised.
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            DifyAPIError: If the batch endpoint itself rejects the request, or
+                its response does not hold one sub-response per operation
+        """
+        if batch_endpoint and batch_endpoint not in self._unsupported_batch_endpoints:
+            try:
+                response = await self._client.post(batch_endpoint, json=build_pipeline(ops))
+            except DifyAPIError as e:
+                if not is_batch_unsupported(e):
+                    raise
+                self._unsupported_batch_endpoints.add(batch_endpoint)
+            else:
+                self._cache.invalidate()
+                return parse_pipeline(response, ops)
+        results = await gather_limited(self._run_op, ops, concurrency)
+        self._cache.invalidate()
+        return results
+
+    async def _run_op(self, op: BatchOp) -> BatchResult:
+        """Run a single batch operation as its own request.
+
+        Args:
+            op: Operation to run
+
+        Returns:
+            Result of the operation
+        """
+        try:
+            status_code, data = await self._client.request_with_status(op.method, op.path, json=op.body)
+        except DifyError as e:
+            return result_from_error(e)
+        return BatchResult(status_code=status_code, data=data)
@@ -1,29 +1,113 @@
 """Tags client for Dify API."""
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Union
 
 from .._base import BaseClient
+from .._cache import DEFAULT_LIST_CACHE_TTL, TTLCache
+from .._concurrency import DEFAULT_CONCURRENCY, map_limited
+from .._exceptions import DifyAPIError, DifyError
+from .._json import EMPTY_JSON_OBJECT
+from ._batch import (
+    build_pipeline,
+    is_batch_unsupported,
+    parse_pipeline,
+    result_from_error,
+)
+from ._fast import FastKnowledgeTag, parse_fast_tags
 from .models import (
-    BindDatasetToTagRequest,
+    _TAG_LIST_ADAPTER,
+    BatchOp,
+    BatchResult,
     CreateKnowledgeTagRequest,
     DatasetTagsResponse,
-    DeleteKnowledgeTagRequest,
     KnowledgeTag,
-    UnbindDatasetFromTagRequest,
     UpdateKnowledgeTagRequest,
+    _check_tag_name,
 )
 
+_TAGS_CACHE_KEY = "tags"
+_FAST_TAGS_CACHE_KEY = "tags_fast"
+
+
+class FastTagsClient:
+    """Read-only tag queries that skip response validation.
+
+    Returns FastKnowledgeTag tuples instead of KnowledgeTag models, for hot
+    read paths against a server trusted to send well-formed responses.
+    Reached as ``client.tags.fast``; shares the list cache with it, so tag
+    changes made through the client refresh both.
+    """
+
+    def __init__(self, base_client: BaseClient, cache: TTLCache) -> None:
+        """Initialize the fast tags client.
+
+        Args:
+            base_client: Base HTTP client for making API requests
+            cache: List cache shared with the owning TagsClient
+        """
+        self._client = base_client
+        self._cache = cache
+
+    def list(self) -> List[FastKnowledgeTag]:
+        """Get list of knowledge type tags without validating them.
+
+        Cached like TagsClient.list().
+
+        Returns:
+            List of knowledge tags
+
+        Raises:
+            DifyAPIError: For API errors
+        """
+        cached = self._cache.get(_FAST_TAGS_CACHE_KEY)
+        if cached is not None:
+            return list(cached)
+        generation = self._cache.generation
+        response = self._client.get("/v1/datasets/tags")
+        tags = parse_fast_tags(response.get("data", []))
+        self._cache.set(_FAST_TAGS_CACHE_KEY, tags, generation)
+        return list(tags)
+
+    def get_dataset_tags(self, dataset_id: str) -> List[FastKnowledgeTag]:
+        """Get tags bound to a dataset without validating them.
+
+        Args:
+            dataset_id: Dataset ID
+
+        Returns:
+            List of bound tags
+
+        Raises:
+            DifyNotFoundError: If dataset not found
+            DifyAPIError: For other API errors
+        """
+        response = self._client.post(f"/v1/datasets/{dataset_id}/tags", content=EMPTY_JSON_OBJECT)
+        return parse_fast_tags(response.get("data", []))
+
 
 class TagsClient:
-    """Client for tag management operations."""
+    """Client for tag management operations.
+
+    ``fast`` offers list() and get_dataset_tags() returning unvalidated
+    FastKnowledgeTag tuples.
+    """
 
-    def __init__(self, base_client: BaseClient) -> None:
+    def __init__(self, base_client: BaseClient, list_cache_ttl: float = DEFAULT_LIST_CACHE_TTL) -> None:
         """Initialize the tags client.
 
         Args:
             base_client: Base HTTP client for making API requests
+            list_cache_ttl: Seconds list() results are reused before being
+                fetched again; 0 disables caching (default: 5.0)
         """
         self._client = base_client
+        self._cache = TTLCache(list_cache_ttl)
+        self._unsupported_batch_endpoints: Set[str] = set()
+        self.fast = FastTagsClient(base_client, self._cache)
+
+    def invalidate_cache(self) -> None:
+        """Drop cached list() results so the next call fetches fresh data."""
+        self._cache.invalidate()
 
     # ===== Knowledge Tag Operations =====
     def create(self, name: str) -> KnowledgeTag:
@@ -36,28 +120,35 @@ class TagsClient:
             Created tag information
 
         Raises:
-            DifyValidationError: If name is invalid or too long
+            ValidationError: If name is not a string or longer than 50 characters
+            DifyValidationError: If the API rejects the name
             DifyAPIError: For other API errors
         """
-        request = CreateKnowledgeTagRequest(name=name)
-        response = self._client.post("/v1/datasets/tags", json=request.model_dump())
-        return KnowledgeTag(**response)
+        name = _check_tag_name(CreateKnowledgeTagRequest, name=name)
+        response = self._client.post("/v1/datasets/tags", json={"name": name})
+        self._cache.invalidate()
+        return KnowledgeTag.model_validate(response)
 
     def list(self) -> List[KnowledgeTag]:
         """Get list of knowledge type tags.
 
+        Results are reused for ``list_cache_ttl`` seconds and refreshed after
+        any tag change made through this client.
+
         Returns:
             List of knowledge tags
 
         Raises:
             DifyAPIError: For API errors
         """
+        cached = self._cache.get(_TAGS_CACHE_KEY)
+        if cached is not None:
+            return list(cached)
+        generation = self._cache.generation
         response = self._client.get("/v1/datasets/tags")
-        # Handle both list and dict response formats
-        if isinstance(response, list):
-            return [KnowledgeTag(**tag) for tag in response]
-        else:
-            return [KnowledgeTag(**tag) for tag in response.get("data", [])]
+        tags = _TAG_LIST_ADAPTER.validate_python(response.get("data", []))
+        self._cache.set(_TAGS_CACHE_KEY, tags, generation)
+        return list(tags)
 
     def update(self, tag_id: str, name: str) -> KnowledgeTag:
         """Update knowledge type tag name.
@@ -70,13 +161,15 @@ class TagsClient:
             Updated tag information
 
         Raises:
+            ValidationError: If name is not a string or longer than 50 characters
             DifyNotFoundError: If tag not found
-            DifyValidationError: If name is invalid
+            DifyValidationError: If the API rejects the name
             DifyAPIError: For other API errors
         """
-        request = UpdateKnowledgeTagRequest(name=name, tag_id=tag_id)
-        response = self._client.patch("/v1/datasets/tags", json=request.model_dump())
-        return KnowledgeTag(**response)
+        name = _check_tag_name(UpdateKnowledgeTagRequest, name=name, tag_id=tag_id)
+        response = self._client.patch("/v1/datasets/tags", json={"name": name, "tag_id": tag_id})
+        self._cache.invalidate()
+        return KnowledgeTag.model_validate(response)
 
     def delete(self, tag_id: str) -> Dict[str, Any]:
         """Delete a knowledge type tag.
@@ -91,8 +184,9 @@ class TagsClient:
             DifyNotFoundError: If tag not found
             DifyAPIError: For other API errors
         """
-        request = DeleteKnowledgeTagRequest(tag_id=tag_id)
-        return self._client.delete("/v1/datasets/tags", json=request.model_dump())
+        result: Dict[str, Any] = self._client.delete("/v1/datasets/tags", json={"tag_id": tag_id})
+        self._cache.invalidate()
+        return result
 
     def bind_to_dataset(
         self,
@@ -113,8 +207,12 @@ class TagsClient:
             DifyValidationError: If tag IDs are invalid
             DifyAPIError: For other API errors
         """
-        request = BindDatasetToTagRequest(tag_ids=tag_ids, target_id=dataset_id)
-        return self._client.post("/v1/datasets/tags/binding", json=request.model_dump())
+        result: Dict[str, Any] = self._client.post(
+            "/v1/datasets/tags/binding",
+            json={"tag_ids": tag_ids, "target_id": dataset_id},
+        )
+        self._cache.invalidate()
+        return result
 
     def unbind_from_dataset(
         self,
@@ -134,8 +232,12 @@ class TagsClient:
             DifyNotFoundError: If dataset or tag not found
             DifyAPIError: For other API errors
         """
-        request = UnbindDatasetFromTagRequest(tag_id=tag_id, target_id=dataset_id)
-        return self._client.post("/v1/datasets/tags/unbinding", json=request.model_dump())
+        result: Dict[str, Any] = self._client.post(
+            "/v1/datasets/tags/unbinding",
+            json={"tag_id": tag_id, "target_id": dataset_id},
+        )
+        self._cache.invalidate()
+        return result
 
     def get_dataset_tags(
         self,
@@ -155,15 +257,152 @@ class TagsClient:
             DifyNotFoundError: If dataset not found
             DifyAPIError: For other API errors
         """
-        response = self._client.post(f"/v1/datasets/{dataset_id}/tags", json={})
-        # Handle both list and dict response formats
+        response = self._client.post(f"/v1/datasets/{dataset_id}/tags", content=EMPTY_JSON_OBJECT)
+        tags = _TAG_LIST_ADAPTER.validate_python(response.get("data", []))
         if return_detail:
-            if isinstance(response, list):
-                tags = [KnowledgeTag(**tag) for tag in response]
-                return DatasetTagsResponse(data=tags, total=len(tags))
-            return DatasetTagsResponse(**response)
+            return DatasetTagsResponse(data=tags, total=response.get("total", len(tags)))
+        return tags
 
-        if isinstance(response, list):
-            return [KnowledgeTag(**tag) for tag in response]
-        return [KnowledgeTag(**tag) for tag in response.get("data", [])]
+    # ===== Bulk Operations =====
+    def create_many(
+        self,
+        names: Sequence[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[KnowledgeTag, BaseException]]:
+        """Create several knowledge type tags concurrently.
 
+        Args:
+            names: Tag names (max 50 characters each)
+            concurrency: Maximum number of requests in flight (default: 20)
+            return_exceptions: Return per-item exceptions in place of results
+                instead of raising the first failure (default: False)
+
+        Returns:
+            Created tags in the same order as ``names``
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            ValidationError: If a name is not a string or too long (unless return_exceptions)
+            DifyValidationError: If the API rejects a name (unless return_exceptions)
+            DifyAPIError: For other API errors (unless return_exceptions)
+        """
+        return map_limited(self.create, names, concurrency, return_exceptions)
+
+    def delete_many(
+        self,
+        tag_ids: Sequence[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Delete several knowledge type tags concurrently.
+
+        Args:
+            tag_ids: Tag IDs
+            concurrency: Maximum number of requests in flight (default: 20)
+            return_exceptions: Return per-item exceptions in place of results
+                instead of raising the first failure (default: False)
+
+        Returns:
+            Success responses in the same order as ``tag_ids``
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            DifyNotFoundError: If a tag is not found (unless return_exceptions)
+            DifyAPIError: For other API errors (unless return_exceptions)
+        """
+        return map_limited(self.delete, tag_ids, concurrency, return_exceptions)
+
+    def bind_many(
+        self,
+        tag_ids_by_dataset: Mapping[str, List[str]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Bind several datasets to knowledge type tags concurrently.
+
+        Args:
+            tag_ids_by_dataset: Mapping of dataset ID to the tag IDs to bind
+            concurrency: Maximum number of requests in flight (default: 20)
+            return_exceptions: Return per-item exceptions in place of results
+                instead of raising the first failure (default: False)
+
+        Returns:
+            Success responses in the mapping's iteration order
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            DifyNotFoundError: If a dataset or tag is not found (unless return_exceptions)
+            DifyAPIError: For other API errors (unless return_exceptions)
+        """
+        return map_limited(
+            lambda item: self.bind_to_dataset(*item),
+            tag_ids_by_dataset.items(),
+            concurrency,
+            return_exceptions,
+        )
+
+    # ===== Batch Operations =====
+    def batch(
+        self,
+        ops: Sequence[BatchOp],
+        *,
+        batch_endpoint: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> List[BatchResult]:
+        """Run several tag API calls as one batch.
+
+        When ``batch_endpoint`` points at a batch-requests gateway in front of
+        Dify (e.g. APISIX ``/v1/batch``), all operations are sent in a single
+        HTTP request. Dify itself has no batch endpoint, so by default, and
+        once the endpoint has answered 404/405/501, the operations are
+        dispatched concurrently as individual requests instead.
+
+        Args:
+            ops: Operations to run, e.g.
+                ``BatchOp(method="POST", path="/v1/datasets/tags",
+                body=CreateKnowledgeTagRequest(name="A").model_dump())``
+            batch_endpoint: Path of a batch-requests endpoint (optional)
+            concurrency: Maximum number of requests in flight when dispatching
+                individually (default: 20)
+
+        Returns:
+            One result per operation, in order. Failures of individual
+            operations are reported in the result instead of being raised.
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            DifyAPIError: If the batch endpoint itself rejects the request, or
+                its response does not hold one sub-response per operation
+        """
+        if batch_endpoint and batch_endpoint not in self._unsupported_batch_endpoints:
+            try:
+                response = self._client.post(batch_endpoint, json=build_pipeline(ops))
+            except DifyAPIError as e:
+                if not is_batch_unsupported(e):
+                    raise
+                self._unsupported_batch_endpoints.add(batch_endpoint)
+            else:
+                self._cache.invalidate()
+                return parse_pipeline(response, ops)
+        results = map_limited(self._run_op, ops, concurrency)
+        self._cache.invalidate()
+        return results
+
+    def _run_op(self, op: BatchOp) -> BatchResult:
+        """Run a single batch operation as its own request.
+
+        Args:
+            op: Operation to run
+
+        Returns:
+            Result of the operation
+        """
+        try:
+            status_code, data = self._client.request_with_status(op.method, op.path, json=op.body)
+        except DifyError as e:
+            return result_from_error(e)
+        return BatchResult(status_code=status_code, data=data)
@@ -1,15 +1,18 @@
 """Models for tags module."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional, Type
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Longest tag name the API accepts
+TAG_NAME_MAX_LENGTH = 50
 
 
 # ===== Knowledge Tag Models =====
 class KnowledgeTag(BaseModel):
     """Knowledge base tag information."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     id: str = Field(description="Tag ID")
     name: str = Field(description="Tag name")
@@ -19,6 +22,10 @@ class KnowledgeTag(BaseModel):
     binding_count: Optional[int] = Field(None, description="Number of bindings")
 
 
+# Parses a whole tag list in one pydantic-core call
+_TAG_LIST_ADAPTER: TypeAdapter[List[KnowledgeTag]] = TypeAdapter(List[KnowledgeTag])
+
+
 class DatasetTagsResponse(BaseModel):
     """Response model for dataset tag list."""
 
@@ -33,7 +40,7 @@ class CreateKnowledgeTagRequest(BaseModel):
 
     model_config = ConfigDict(extra="ignore")
 
-    name: str = Field(description="Tag name", max_length=50)
+    name: str = Field(description="Tag name", max_length=TAG_NAME_MAX_LENGTH)
 
 
 class UpdateKnowledgeTagRequest(BaseModel):
@@ -41,10 +48,34 @@ class UpdateKnowledgeTagRequest(BaseModel):
 
     model_config = ConfigDict(extra="ignore")
 
-    name: str = Field(description="Tag name", max_length=50)
+    name: str = Field(description="Tag name", max_length=TAG_NAME_MAX_LENGTH)
     tag_id: str = Field(description="Tag ID")
 
 
+def _check_tag_name(model: Type[BaseModel], **fields: Any) -> str:
+    """Check a tag name locally, without a round trip.
+
+    The common case is a single type and length check. Anything else is
+    validated through ``model``, so the ValidationError raised, or the
+    coerced name returned (e.g. for bytes), is the same as when the payload
+    was built from the request model.
+
+    Args:
+        model: Request model to validate with
+        **fields: Request fields, including ``name``
+
+    Returns:
+        The name to send
+
+    Raises:
+        ValidationError: If name is not a valid tag name
+    """
+    name = fields["name"]
+    if isinstance(name, str) and len(name) <= TAG_NAME_MAX_LENGTH:
+        return name
+    return model(**fields).name  # type: ignore[attr-defined, no-any-return]
+
+
 class DeleteKnowledgeTagRequest(BaseModel):
     """Request model for deleting knowledge tag."""
 
@@ -71,4 +102,32 @@ class UnbindDatasetFromTagRequest(BaseModel):
     target_id: str = Field(description="Dataset ID")
 
 
- 
+# ===== Batch Models =====
+class BatchOp(BaseModel):
+    """A single API call to run as part of a batch.
+
+    The body is usually built from a request model, e.g.
+    ``CreateKnowledgeTagRequest(name="A").model_dump()``.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    method: Literal["GET", "POST", "PATCH", "DELETE"] = Field(description="HTTP method")
+    path: str = Field(description="API path, e.g. /v1/datasets/tags")
+    body: Optional[Dict[str, Any]] = Field(None, description="JSON request body")
+
+
+class BatchResult(BaseModel):
+    """Outcome of a single batched API call."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    status_code: Optional[int] = Field(default=None, description="HTTP status code, when known")
+    data: Any = Field(default=None, description="Parsed response body on success")
+    error: Optional[str] = Field(default=None, description="Error message on failure")
+    error_code: Optional[str] = Field(default=None, description="Dify error code on failure")
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
@@ -0,0 +1,49 @@
+"""Shared fixtures: SDK clients wired to an in-memory httpx transport."""
+
+from typing import Any, Callable, Iterator, List
+
+import httpx
+import pytest
+
+from dify_dataset_sdk import AsyncDifyDatasetClient, DifyDatasetClient
+from dify_dataset_sdk._json import loads
+
+BASE_URL = "http://dify.test"
+
+
+def json_body(request: httpx.Request) -> Any:
+    """Decode the JSON body of a captured request."""
+    return loads(request.content) if request.content else None
+
+
+@pytest.fixture
+def make_client() -> Iterator[Callable[..., DifyDatasetClient]]:
+    """Build sync clients whose requests are answered by ``handler``."""
+    clients: List[DifyDatasetClient] = []
+
+    def factory(handler: Callable[[httpx.Request], httpx.Response], **kwargs: Any) -> DifyDatasetClient:
+        client = DifyDatasetClient("test-key", base_url=BASE_URL, **kwargs)
+        client._base._client.close()
+        client._base._client = httpx.Client(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def make_async_client() -> Callable[..., AsyncDifyDatasetClient]:
+    """Build async clients whose requests are answered by ``handler``.
+
+    ``handler`` may be a plain or an async function. Use the client as an
+    async context manager so it is closed.
+    """
+
+    def factory(handler: Callable[[httpx.Request], Any], **kwargs: Any) -> AsyncDifyDatasetClient:
+        client = AsyncDifyDatasetClient("test-key", base_url=BASE_URL, **kwargs)
+        client._base._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    return factory
@@ -0,0 +1,102 @@
+"""Tests for request coalescing in the async tags and metadata clients."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from .conftest import json_body
+
+
+class FakeServer:
+    """In-memory tag/metadata API whose first read can be held open."""
+
+    def __init__(self) -> None:
+        self.tags = ["a"]
+        self.fields = ["f1"]
+        self.reads = 0
+        self.hold_first_read = asyncio.Event()
+        self.first_read_started = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "GET" or (path.endswith("/tags") and path != "/v1/datasets/tags"):
+            self.reads += 1
+            snapshot_tags, snapshot_fields = list(self.tags), list(self.fields)
+            if self.reads == 1:
+                self.first_read_started.set()
+                await self.hold_first_read.wait()
+            if path.endswith("/metadata"):
+                return httpx.Response(200, json={"doc_metadata": [{"id": f, "type": "string", "name": f} for f in snapshot_fields], "built_in_field_enabled": False})
+            return httpx.Response(200, json={"data": [{"id": t, "name": t} for t in snapshot_tags], "total": len(snapshot_tags)})
+        if path == "/v1/datasets/tags":
+            self.tags.append(json_body(request)["name"])
+            return httpx.Response(200, json={"id": self.tags[-1], "name": self.tags[-1]})
+        if path == "/v1/datasets/tags/binding":
+            self.tags.extend(json_body(request)["tag_ids"])
+            return httpx.Response(200, json={"result": "success"})
+        self.fields.append(json_body(request)["name"])
+        return httpx.Response(200, json={"id": self.fields[-1], "type": "string", "name": self.fields[-1]})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_list_calls_share_one_request(make_async_client):
+    server = FakeServer()
+    server.hold_first_read.set()
+
+    async with make_async_client(server, list_cache_ttl=0) as client:
+        results = await asyncio.gather(*(client.tags.list() for _ in range(10)))
+
+    assert server.reads == 1
+    assert all([t.name for t in result] == ["a"] for result in results)
+    assert len({id(result) for result in results}) == 10
+
+
+@pytest.mark.asyncio
+async def test_list_after_write_does_not_join_earlier_fetch(make_async_client):
+    server = FakeServer()
+
+    async with make_async_client(server) as client:
+        stale = asyncio.ensure_future(client.tags.list())
+        await server.first_read_started.wait()
+        await client.tags.create("new")
+        # Joining the held-open fetch would never return
+        fresh = await asyncio.wait_for(client.tags.list(), timeout=1)
+        server.hold_first_read.set()
+        await stale
+
+        assert [t.name for t in fresh] == ["a", "new"]
+        # The stale fetch finished last but must not have been cached
+        assert [t.name for t in await client.tags.list()] == ["a", "new"]
+
+
+@pytest.mark.asyncio
+async def test_dataset_tags_after_bind_does_not_join_earlier_fetch(make_async_client):
+    server = FakeServer()
+
+    async with make_async_client(server) as client:
+        stale = asyncio.ensure_future(client.tags.get_dataset_tags("d1"))
+        await server.first_read_started.wait()
+        await client.tags.bind_to_dataset("d1", ["b"])
+        # Joining the held-open fetch would never return
+        fresh = await asyncio.wait_for(client.tags.get_dataset_tags("d1"), timeout=1)
+        server.hold_first_read.set()
+
+        assert [t.name for t in await stale] == ["a"]
+        assert [t.name for t in fresh] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_metadata_list_after_write_does_not_join_earlier_fetch(make_async_client):
+    server = FakeServer()
+
+    async with make_async_client(server) as client:
+        stale = asyncio.ensure_future(client.metadata.list("d1"))
+        await server.first_read_started.wait()
+        await client.metadata.create("d1", "string", "f2")
+        # Joining the held-open fetch would never return
+        fresh = await asyncio.wait_for(client.metadata.list("d1"), timeout=1)
+        server.hold_first_read.set()
+        await stale
+
+        assert [f.name for f in fresh.doc_metadata] == ["f1", "f2"]
@@ -0,0 +1,108 @@
+"""Tests for TagsClient.batch and the pipeline helpers."""
+
+import httpx
+import pytest
+
+from dify_dataset_sdk import BatchOp, DifyAPIError
+from dify_dataset_sdk.tags._batch import build_pipeline, parse_pipeline
+
+from .conftest import json_body
+
+OPS = [
+    BatchOp(method="POST", path="/v1/datasets/tags", body={"name": "a"}),
+    BatchOp(method="DELETE", path="/v1/datasets/tags", body={"tag_id": "t0"}),
+]
+
+
+def test_build_pipeline_encodes_bodies():
+    pipeline = build_pipeline(OPS)["pipeline"]
+
+    assert pipeline[0] == {"method": "POST", "path": "/v1/datasets/tags", "body": '{"name":"a"}'}
+    assert pipeline[1]["body"] == '{"tag_id":"t0"}'
+
+
+def test_parse_pipeline_maps_each_sub_response():
+    response = {
+        "data": [
+            {"status": 200, "body": '{"id": "t1", "name": "a"}'},
+            {"status": 404, "body": ""},
+            {"status": 200, "body": '[{"id": "t1"}]'},
+        ]
+    }
+
+    results = parse_pipeline(response, [*OPS, BatchOp(method="GET", path="/v1/datasets/d1/tags")])
+
+    assert results[0].ok and results[0].status_code == 200
+    assert results[0].data == {"id": "t1", "name": "a"}
+    assert not results[1].ok and results[1].status_code == 404
+    # Bare arrays are wrapped the same way as for a single request
+    assert results[2].data == {"data": [{"id": "t1"}]}
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"message": "gateway error"},
+        {"data": [{"status": 200, "body": "{}"}]},
+        {"data": [{"status": 200, "body": "{}"}] * 3},
+        {"data": ["not an object", "either"]},
+        {"data": [{"status": "200", "body": "{}"}, {"status": 200, "body": "{}"}]},
+        {"data": [{"body": "{}"}, {"status": 200, "body": "{}"}]},
+        {"data": [{"status": 200, "body": 123}, {"status": 200, "body": "{}"}]},
+    ],
+)
+def test_parse_pipeline_rejects_mismatched_responses(response):
+    with pytest.raises(DifyAPIError):
+        parse_pipeline(response, OPS)
+
+
+def test_batch_sends_one_pipeline_request(make_client):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[{"status": 200, "body": "{}"}, {"status": 200, "body": "{}"}])
+
+    client = make_client(handler)
+    results = client.tags.batch(OPS, batch_endpoint="/v1/batch")
+
+    assert [r.status_code for r in results] == [200, 200]
+    assert len(requests) == 1
+    assert len(json_body(requests[0])["pipeline"]) == 2
+
+
+def test_batch_falls_back_to_single_requests(make_client):
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append((request.method, request.url.path))
+        if request.url.path == "/v1/batch":
+            return httpx.Response(404)
+        if request.method == "POST":
+            return httpx.Response(201, json={"id": "t1", "name": "a"})
+        return httpx.Response(204)
+
+    client = make_client(handler)
+    results = client.tags.batch(OPS, batch_endpoint="/v1/batch")
+    client.tags.batch(OPS, batch_endpoint="/v1/batch")
+
+    assert [r.status_code for r in results] == [201, 204]
+    assert results[0].data == {"id": "t1", "name": "a"}
+    # The endpoint is remembered as unsupported and not asked again
+    assert paths.count(("POST", "/v1/batch")) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_batch_falls_back_with_status_codes(make_async_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/batch":
+            return httpx.Response(405)
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "t1", "name": "a"})
+        return httpx.Response(404)
+
+    async with make_async_client(handler) as client:
+        results = await client.tags.batch(OPS, batch_endpoint="/v1/batch")
+
+    assert [r.status_code for r in results] == [200, 404]
+    assert results[0].ok and not results[1].ok
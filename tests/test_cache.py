@@ -0,0 +1,76 @@
+"""Tests for the TTL list cache."""
+
+import time
+
+import httpx
+
+from dify_dataset_sdk._cache import TTLCache
+
+
+def test_get_returns_fresh_values_and_drops_expired_ones():
+    cache = TTLCache(ttl=0.05)
+    cache.set("k", [1])
+
+    assert cache.get("k") == [1]
+    time.sleep(0.06)
+    assert cache.get("k") is None
+
+
+def test_zero_ttl_disables_caching():
+    cache = TTLCache(ttl=0)
+    cache.set("k", 1)
+
+    assert not cache.enabled
+    assert cache.get("k") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.get("b") is None
+
+
+def test_invalidate_drops_one_or_all_entries():
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    assert cache.get("a") is None and cache.get("b") == 2
+    cache.invalidate()
+    assert cache.get("b") is None
+
+
+def test_set_drops_values_fetched_before_an_invalidation():
+    cache = TTLCache(ttl=10)
+    generation = cache.generation
+    cache.invalidate("other")
+
+    cache.set("k", "stale", generation)
+    assert cache.get("k") is None
+    cache.set("k", "fresh", cache.generation)
+    assert cache.get("k") == "fresh"
+
+
+def test_sync_list_is_not_cached_across_a_concurrent_write(make_client):
+    tags = ["a"]
+    client = None
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            snapshot = list(tags)
+            # A write lands while the list response is on its way
+            tags.append("new")
+            client.tags.invalidate_cache()
+            return httpx.Response(200, json={"data": [{"id": t, "name": t} for t in snapshot]})
+        return httpx.Response(200, json={})
+
+    client = make_client(handler)
+
+    assert [t.name for t in client.tags.list()] == ["a"]
+    assert [t.name for t in client.tags.list()] == ["a", "new"]
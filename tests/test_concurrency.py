@@ -0,0 +1,134 @@
+"""Tests for the bounded-concurrency and single-flight helpers."""
+
+import asyncio
+
+import pytest
+
+from dify_dataset_sdk._concurrency import SingleFlight, gather_limited, map_limited
+
+
+def test_map_limited_keeps_order_and_collects_exceptions():
+    def func(item: int) -> int:
+        if item == 2:
+            raise ValueError(item)
+        return item * 10
+
+    results = map_limited(func, [1, 2, 3], concurrency=2, return_exceptions=True)
+
+    assert results[0] == 10 and results[2] == 30
+    assert isinstance(results[1], ValueError)
+    with pytest.raises(ValueError):
+        map_limited(func, [1, 2, 3])
+    with pytest.raises(ValueError):
+        map_limited(func, [1], concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_caps_calls_in_flight():
+    running = 0
+    peak = 0
+
+    async def func(item: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return item
+
+    assert await gather_limited(func, range(10), concurrency=3) == list(range(10))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_stops_after_the_first_failure():
+    started = []
+    finished = []
+
+    async def func(item: int) -> int:
+        started.append(item)
+        await asyncio.sleep(0.01 if item else 0)
+        if item == 0:
+            raise ValueError(item)
+        finished.append(item)
+        return item
+
+    with pytest.raises(ValueError):
+        await gather_limited(func, range(10), concurrency=2)
+    started_at_failure = list(started)
+    await asyncio.sleep(0.05)
+
+    assert started_at_failure == [0, 1]
+    assert started == started_at_failure
+    # The call in flight was cancelled rather than left running
+    assert finished == []
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_runs_everything_with_return_exceptions():
+    async def func(item: int) -> int:
+        if item == 0:
+            raise ValueError(item)
+        return item
+
+    results = await gather_limited(func, range(5), concurrency=2, return_exceptions=True)
+
+    assert isinstance(results[0], ValueError)
+    assert results[1:] == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch() -> list:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return ["a"]
+
+    waiters = [asyncio.ensure_future(flight.do("key", fetch)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    # The key is forgotten once the call completes
+    assert await flight.do("key", fetch) == ["a"]
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors_to_every_caller():
+    flight = SingleFlight()
+
+    async def fail() -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(*(flight.do("key", fail) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelling_one_caller_keeps_the_call():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", fetch))
+    second = asyncio.ensure_future(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+    assert first.cancelled()
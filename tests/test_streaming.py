@@ -0,0 +1,95 @@
+"""Tests for incremental JSON parsing and metadata streaming."""
+
+import httpx
+import pytest
+
+from dify_dataset_sdk import DifyAPIError, DifyNotFoundError, Metadata, _json
+from dify_dataset_sdk._json import JSONItemParser
+
+DOCUMENT = (
+    b'{"doc_metadata": [{"id": "m1", "type": "string", "name": "\xe4\xbd\x9c\xe8\x80\x85"}, '
+    b'{"id": "m2", "type": "number", "name": "n", "use_count": 2}], "built_in_field_enabled": true}'
+)
+
+
+@pytest.fixture(params=["ijson", "fallback"])
+def parser_backend(request, monkeypatch):
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(_json, "ijson", None)
+    return request.param
+
+
+def _parse(chunks):
+    parser = JSONItemParser("doc_metadata.item")
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    return items + parser.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, len(DOCUMENT)])
+def test_parser_yields_items_across_chunk_boundaries(parser_backend, chunk_size):
+    chunks = [DOCUMENT[i : i + chunk_size] for i in range(0, len(DOCUMENT), chunk_size)]
+
+    items = _parse(chunks)
+
+    assert [item["id"] for item in items] == ["m1", "m2"]
+    assert items[0]["name"] == "作者" and items[1]["use_count"] == 2
+
+
+def test_parser_yields_items_before_the_document_ends():
+    pytest.importorskip("ijson")
+    parser = JSONItemParser("doc_metadata.item")
+
+    assert [item["id"] for item in parser.feed(DOCUMENT[:80])] == ["m1"]
+
+
+def test_parser_ignores_other_keys(parser_backend):
+    assert _parse([b'{"data": [1, 2], "doc_metadata": []}']) == []
+
+
+@pytest.mark.parametrize("body", [b'{"doc_metadata": [{"id": ', b"not json", b""])
+def test_parser_raises_value_error_on_invalid_json(parser_backend, body):
+    with pytest.raises(ValueError):
+        _parse([body])
+
+
+def _metadata_handler(request: httpx.Request) -> httpx.Response:
+    dataset_id = request.url.path.split("/")[3]
+    if dataset_id == "missing":
+        return httpx.Response(404)
+    if dataset_id == "broken":
+        return httpx.Response(200, content=DOCUMENT[:60])
+    return httpx.Response(200, content=DOCUMENT)
+
+
+def test_iter_list_yields_metadata(make_client, parser_backend):
+    client = make_client(_metadata_handler)
+
+    fields = list(client.metadata.iter_list("d1"))
+
+    assert [f.id for f in fields] == ["m1", "m2"]
+    assert all(isinstance(f, Metadata) for f in fields)
+
+
+def test_iter_list_maps_errors(make_client):
+    client = make_client(_metadata_handler)
+
+    with pytest.raises(DifyNotFoundError):
+        list(client.metadata.iter_list("missing"))
+    with pytest.raises(DifyAPIError):
+        list(client.metadata.iter_list("broken"))
+
+
+@pytest.mark.asyncio
+async def test_async_iter_list(make_async_client):
+    async with make_async_client(_metadata_handler) as client:
+        fields = [f.id async for f in client.metadata.iter_list("d1")]
+        with pytest.raises(DifyNotFoundError):
+            [f async for f in client.metadata.iter_list("missing")]
+        with pytest.raises(DifyAPIError):
+            [f async for f in client.metadata.iter_list("broken")]
+
+    assert fields == ["m1", "m2"]
@@ -0,0 +1,111 @@
+"""Tests for the tags clients."""
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from dify_dataset_sdk import FastKnowledgeTag, KnowledgeTag
+
+from .conftest import json_body
+
+
+def _tag_handler(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = json_body(request) or {}
+        return httpx.Response(200, json={"id": body.get("tag_id", "t1"), "name": body.get("name", "")})
+
+    return handler
+
+
+def test_create_sends_name(make_client):
+    requests = []
+    client = make_client(_tag_handler(requests))
+
+    tag = client.tags.create("x" * 50)
+
+    assert tag.name == "x" * 50
+    assert json_body(requests[0]) == {"name": "x" * 50}
+
+
+def test_create_and_update_send_coerced_bytes_name(make_client):
+    requests = []
+    client = make_client(_tag_handler(requests))
+
+    client.tags.create(b"x")
+    client.tags.update("t1", b"x")
+
+    assert json_body(requests[0]) == {"name": "x"}
+    assert json_body(requests[1]) == {"name": "x", "tag_id": "t1"}
+
+
+@pytest.mark.parametrize("name", ["x" * 51, b"x" * 51, 123])
+def test_create_and_update_reject_invalid_name_locally(make_client, name):
+    requests = []
+    client = make_client(_tag_handler(requests))
+
+    with pytest.raises(ValidationError):
+        client.tags.create(name)
+    with pytest.raises(ValidationError):
+        client.tags.update("t1", name)
+    assert requests == []
+
+
+@pytest.mark.asyncio
+async def test_async_create_rejects_long_name_locally(make_async_client):
+    requests = []
+
+    async with make_async_client(_tag_handler(requests)) as client:
+        with pytest.raises(ValidationError):
+            await client.tags.create("x" * 60)
+        with pytest.raises(ValidationError):
+            await client.tags.update("t1", "x" * 60)
+        tag = await client.tags.update("t1", "new")
+
+    assert tag.name == "new"
+    assert len(requests) == 1
+
+
+def _list_handler(tags):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET" or request.url.path != "/v1/datasets/tags":
+            return httpx.Response(200, json={"data": [{"id": t, "name": t, "extra": 1} for t in tags], "total": 9})
+        tags.append(json_body(request)["name"])
+        return httpx.Response(200, json={"id": tags[-1], "name": tags[-1]})
+
+    return handler
+
+
+def test_default_reads_return_validated_models(make_client):
+    client = make_client(_list_handler(["a"]))
+
+    assert all(isinstance(t, KnowledgeTag) for t in client.tags.list())
+    detail = client.tags.get_dataset_tags("d1", return_detail=True)
+    assert isinstance(detail.data[0], KnowledgeTag)
+    assert detail.model_dump()["data"] == [
+        {"id": "a", "name": "a", "color": None, "created_at": None, "updated_at": None, "binding_count": None}
+    ]
+
+
+def test_fast_reads_return_fast_tags_and_share_the_cache(make_client):
+    tags = ["a"]
+    client = make_client(_list_handler(tags))
+
+    fast = client.tags.fast.list()
+    assert fast == [FastKnowledgeTag(id="a", name="a")]
+    assert client.tags.fast.get_dataset_tags("d1") == [FastKnowledgeTag(id="a", name="a")]
+
+    client.tags.create("b")
+    assert [t.name for t in client.tags.fast.list()] == ["a", "b"]
+    assert all(isinstance(t, KnowledgeTag) for t in client.tags.list())
+
+
+@pytest.mark.asyncio
+async def test_async_fast_reads(make_async_client):
+    async with make_async_client(_list_handler(["a"])) as client:
+        fast = await client.tags.fast.list()
+        bound = await client.tags.fast.get_dataset_tags("d1")
+        validated = await client.tags.list()
+
+    assert fast == bound == [FastKnowledgeTag(id="a", name="a")]
+    assert isinstance(validated[0], KnowledgeTag)